@@ -1,6 +1,5 @@
-from typing import Annotated, Sequence
+from typing import TYPE_CHECKING, Annotated, Sequence
 
-import pandas as pd
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from pydantic_settings import (
     CliApp,
@@ -9,29 +8,38 @@ from pydantic_settings import (
     CliSubCommand,
 )
 
-from app.config import app_config, pipeline_config
-from app.db.load_templates import (
-    load_grand_totals,
-    load_otp_segmented_pnl,
-    load_otp_unsegmented_pnl,
-    load_rnd_service,
-    load_royalties,
-    load_shared_services_total_charge,
-)
-from app.db.session import create_db_and_tables, session_scope
-from app.etl.loaders.grand_totals import GrandTotalETL
-from app.etl.loaders.gs_divbu_charges import GsDivBuChargesETL
-from app.etl.loaders.otp_segmented_pnl import OtpSegmentedPnlETL
-from app.etl.loaders.rnd_service import RndServiceETL
-from app.etl.loaders.royalties import RoyaltiesETL
-from app.main import run, run_with_context
-from app.pipelines.context import PipelineContext
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from app.pipelines.context import PipelineContext
 
 
 def _load_db_from_sources(
-    df_segmented_pnl: pd.DataFrame,
-    context: PipelineContext | None = None,
+    df_segmented_pnl: "pd.DataFrame",
+    context: "PipelineContext | None" = None,
 ) -> dict[str, int]:
+    # Heavy imports are deferred so `--help` and argument parsing stay fast.
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pandas as pd
+
+    from app.config import app_config
+    from app.db.load_templates import (
+        build_shared_load_context,
+        load_grand_totals,
+        load_otp_segmented_pnl,
+        load_otp_unsegmented_pnl,
+        load_rnd_service,
+        load_royalties,
+        load_shared_services_total_charge,
+    )
+    from app.db.session import create_db_and_tables, session_scope
+    from app.etl.loaders.grand_totals import GrandTotalETL
+    from app.etl.loaders.gs_divbu_charges import GsDivBuChargesETL
+    from app.etl.loaders.otp_segmented_pnl import OtpSegmentedPnlETL
+    from app.etl.loaders.rnd_service import RndServiceETL
+    from app.etl.loaders.royalties import RoyaltiesETL
+
     create_db_and_tables()
     if (
         context is None
@@ -45,30 +53,36 @@ def _load_db_from_sources(
             app_config.data_sources.grand_total.fpath,
             sheet_name=app_config.data_sources.grand_total.sheet_name,
         )
-        df_grand_totals = etl_grand_total.transform()
-
         etl_royalties = RoyaltiesETL(
             app_config.data_sources.royalties,
             app_config.data_sources.royalties.fpath,
             sheet_name=app_config.data_sources.royalties.sheet_name,
         )
-        df_royalties = etl_royalties.transform()
-
         etl_gsdivbu_charges = GsDivBuChargesETL(
             app_config.data_sources.gs_charges,
             app_config.data_sources.gs_charges.fpath,
             sheet_name=app_config.data_sources.gs_charges.sheet_name,
         )
-        df_gsdivbu_charges = etl_gsdivbu_charges.transform()
-
         etl_rnd_services = RndServiceETL(app_config.data_sources.rnd_services)
-        df_rnd_services = etl_rnd_services.transform()
-
         etl_otp_pnl = OtpSegmentedPnlETL(
             app_config.data_sources.otp_segmented_pnl.fpath,
             app_config.data_sources.otp_segmented_pnl.sheet_name,
         )
-        df_otp = etl_otp_pnl.transform()
+
+        # The transforms are independent file reads, so run them concurrently.
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {
+                "grand_totals": executor.submit(etl_grand_total.transform),
+                "royalties": executor.submit(etl_royalties.transform),
+                "gsdivbu_charges": executor.submit(etl_gsdivbu_charges.transform),
+                "rnd_services": executor.submit(etl_rnd_services.transform),
+                "otp": executor.submit(etl_otp_pnl.transform),
+            }
+            df_grand_totals = futures["grand_totals"].result()
+            df_royalties = futures["royalties"].result()
+            df_gsdivbu_charges = futures["gsdivbu_charges"].result()
+            df_rnd_services = futures["rnd_services"].result()
+            df_otp = futures["otp"].result()
     else:
         df_grand_totals = context.grand_totals
         df_royalties = context.royalties
@@ -76,19 +90,55 @@ def _load_db_from_sources(
         df_rnd_services = context.rnd_services
         df_otp = context.otp_pnl
 
+    from app.enums import OtpSegmentedPnlColumns, SapBwColumns
+
+    company_code_col = SapBwColumns.CompanyCode.value
+    otp_company_code_col = OtpSegmentedPnlColumns.CompanyCode.value
+    line_item_col = SapBwColumns.PnlItem.value
+
+    all_codes = pd.concat(
+        [
+            df_grand_totals[company_code_col].dropna().astype(str),
+            df_royalties[company_code_col].dropna().astype(str),
+            df_rnd_services[company_code_col].dropna().astype(str),
+            df_otp[otp_company_code_col].dropna().astype(str),
+            df_segmented_pnl[otp_company_code_col].dropna().astype(str),
+            df_gsdivbu_charges.index.to_series().astype(str),
+        ]
+    ).unique()
+    all_items = pd.concat(
+        [
+            df_grand_totals[line_item_col].dropna().astype(str),
+            df_royalties[line_item_col].dropna().astype(str),
+            df_rnd_services[line_item_col].dropna().astype(str),
+            pd.Series(df_gsdivbu_charges.columns).astype(str),
+        ]
+    ).unique()
+
     with session_scope() as session:
-        return {
-            "grand_totals": load_grand_totals(session, df_grand_totals),
-            "royalties": load_royalties(session, df_royalties),
+        # One shared context amortizes the dimension upserts across loaders,
+        # and deferred commits land the whole load in a single transaction.
+        ctx = build_shared_load_context(session, all_codes, all_items)
+        rows_loaded = {
+            "grand_totals": load_grand_totals(
+                session, df_grand_totals, ctx=ctx, commit=False
+            ),
+            "royalties": load_royalties(session, df_royalties, ctx=ctx, commit=False),
             "shared_services_total_charge": load_shared_services_total_charge(
-                session, df_gsdivbu_charges
+                session, df_gsdivbu_charges, ctx=ctx, commit=False
+            ),
+            "rnd_service": load_rnd_service(
+                session, df_rnd_services, ctx=ctx, commit=False
+            ),
+            "product_business": load_otp_unsegmented_pnl(
+                session, df_otp, ctx=ctx, commit=False
             ),
-            "rnd_service": load_rnd_service(session, df_rnd_services),
-            "product_business": load_otp_unsegmented_pnl(session, df_otp),
             "product_business_segmented": load_otp_segmented_pnl(
-                session, df_segmented_pnl
+                session, df_segmented_pnl, ctx=ctx, commit=False
             ),
         }
+        session.commit()
+        return rows_loaded
 
 
 class All(BaseModel):
@@ -101,6 +151,10 @@ class All(BaseModel):
     ] = False
 
     def cli_cmd(self) -> None:
+        from app.config import pipeline_config
+        from app.main import run, run_with_context
+        from app.pipelines.context import PipelineContext
+
         companies = sorted(
             {
                 *pipeline_config.mixed_activity,
@@ -135,6 +189,9 @@ class Subset(BaseModel):
     ] = False
 
     def cli_cmd(self) -> None:
+        from app.main import run, run_with_context
+        from app.pipelines.context import PipelineContext
+
         context = PipelineContext()
         if self.load_db:
             result, context = run_with_context(list(self.companies), debug=False)
@@ -159,4 +216,9 @@ class Taxflow(BaseModel, cli_prog_name="taxflow"):
         CliApp.run_subcommand(self)
 
 
-cmd = CliApp.run(Taxflow)
+def main() -> None:
+    CliApp.run(Taxflow)
+
+
+if __name__ == "__main__":
+    main()
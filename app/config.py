@@ -1,8 +1,11 @@
 import csv
+import functools
+import io
+import sys
 from pathlib import Path
 from typing import Annotated, List, Optional, Sequence
 
-from pydantic import BaseModel, StringConstraints, field_validator
+from pydantic import BaseModel, StringConstraints, TypeAdapter, field_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -38,6 +41,33 @@ class PipelineConfig(BaseSettings):
     single_activity: Sequence[UpperCaseString] = []
     manual_erosion_entities: Sequence[UpperCaseString] = []
 
+    @functools.cached_property
+    def pipeline_dispatch(self) -> dict:
+        """Entity code -> pipeline class, replacing the factory's if/elif ladder.
+
+        Built lowest-precedence first so later updates preserve the original
+        match order. Imported lazily to keep config free of pipeline imports.
+        """
+        from app.pipelines.complex import (
+            EntrepreneurWithRoutineAndExternalCosts,
+            EntrepreneurWithRoutinePipeline,
+        )
+        from app.pipelines.cost_adjustment_pipeline import CostAdjustmentPipeline
+        from app.pipelines.single_economic_activity import (
+            SingleEconomicActivityPipeline,
+        )
+
+        table: dict = {}
+        for entities, pipeline_cls in (
+            (self.single_activity, SingleEconomicActivityPipeline),
+            (self.mixed_activity, EntrepreneurWithRoutinePipeline),
+            (self.manual_erosion_entities, CostAdjustmentPipeline),
+            (self.mixed_activity_with_external_costs, EntrepreneurWithRoutineAndExternalCosts),
+        ):
+            for entity in entities:
+                table[sys.intern(entity.upper())] = pipeline_cls
+        return table
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -161,6 +191,10 @@ class AppConfig(BaseSettings):
     log_level: str = "INFO"
     log_to_console: bool = True
 
+    # worker processes for the per-company pipeline loop; 1 keeps the
+    # loop sequential
+    max_workers: int = 1
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -180,18 +214,58 @@ class AppConfig(BaseSettings):
         return (yaml_source, *sources)
 
 
+_SEGMENT_CONFIG_ADAPTER = TypeAdapter(List[SegmentConfig])
+
+
 def load_segment_configs(
     csv_path=Path("segments.csv"),
 ) -> List[SegmentConfig]:
     """Load segment configurations from CSV file."""
-    with open(csv_path, encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        segment_config = [SegmentConfig.model_validate(row) for row in reader]
+    data = Path(csv_path).read_bytes()
+    if data[:3] == b"\xef\xbb\xbf":  # strip UTF-8 BOM without a codec wrapper
+        data = data[3:]
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8")))
+
+    return _SEGMENT_CONFIG_ADAPTER.validate_python(list(reader))
+
+
+@functools.cache
+def get_app_config() -> AppConfig:
+    return AppConfig()  # type: ignore
+
+
+@functools.cache
+def get_pipeline_config() -> PipelineConfig:
+    return PipelineConfig()
+
+
+@functools.cache
+def get_segment_config() -> tuple[SegmentConfig, ...]:
+    return tuple(load_segment_configs())
+
+
+@functools.cache
+def get_company_config() -> Sequence[CompanyConfig]:
+    return CompanyConfigs().company_configs  # type: ignore
+
 
-    return segment_config
+_LAZY_ATTRS = {
+    "app_config": get_app_config,
+    "pipeline_config": get_pipeline_config,
+    "segment_config": get_segment_config,
+    "company_config": get_company_config,
+}
 
 
-app_config = AppConfig()  # type: ignore
-pipeline_config = PipelineConfig()
-segment_config = load_segment_configs()
-company_config = CompanyConfigs().company_configs  # type: ignore
+def __getattr__(name: str):
+    # Keep `from app.config import app_config` working while deferring the
+    # YAML/CSV parsing until a config object is first requested. The
+    # factory runs outside the try so a KeyError raised while loading a
+    # config is not mistaken for a missing module attribute.
+    try:
+        factory = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    return factory()
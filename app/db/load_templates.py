@@ -1,10 +1,15 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Iterable, List, Optional, Type
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Type
 
+import numpy as np
 import pandas as pd
 import structlog
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, SQLModel
 
 from app.db import models
 from app.enums import HighLevelSegmentedPnlColumns, OtpSegmentedPnlColumns, SapBwColumns
@@ -20,16 +25,55 @@ class LoadContext:
     line_item_id: Dict[str, int]
 
 
+_ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=16384)
+def _dec_cached(value: str) -> Decimal:
+    return Decimal(value)
+
+
 def _to_decimal(value: object) -> Decimal:
     if value is None or (isinstance(value, float) and pd.isna(value)):
-        return Decimal("0")
-    return Decimal(str(value))
+        return _ZERO
+    return _dec_cached(str(value))
+
+
+def _to_milli(value: object) -> int:
+    """Scale a monetary value to the integer milli-units the tables store."""
+    return int(round(_to_decimal(value) * 1000))
+
+
+def _amounts_to_milli(values: pd.Series) -> list:
+    """Vectorized _to_milli over a whole amount column (NaN/None -> 0).
+
+    One to_numeric pass plus a NumPy scale-and-round replaces a Decimal
+    construction per cell; non-numeric garbage still surfaces as an
+    error rather than being coerced away.
+    """
+    numeric = pd.to_numeric(values, errors="raise")
+    milli = np.rint(
+        np.nan_to_num(numeric.to_numpy(dtype=np.float64), nan=0.0) * 1000
+    )
+    return milli.astype(np.int64).tolist()
 
 
 def _to_int(value: object, default: int = 0) -> int:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if value is None:
         return default
-    return int(str(value))
+    if isinstance(value, float):
+        return default if pd.isna(value) else int(value)
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return int(str(value))
+
+
+def _bulk_insert(session: Session, table_model: Type[SQLModel], rows: list) -> int:
+    """Insert payload dicts in one executemany statement; returns the row count."""
+    if rows:
+        session.execute(insert(table_model), rows)
+    return len(rows)
 
 
 def _line_item_label(value: object) -> str:
@@ -38,6 +82,11 @@ def _line_item_label(value: object) -> str:
     return str(value)
 
 
+def _resolve_ids(series: pd.Series, mapping: Dict[str, int]) -> pd.Series:
+    """Uppercase codes with the pandas string kernel and map them to IDs."""
+    return series.astype("string").str.upper().map(mapping)
+
+
 def prepare_company_codes(
     session: Session,
     company_codes: Iterable[str],
@@ -46,22 +95,20 @@ def prepare_company_codes(
     company_codes = set(
         [c for c in company_codes if c != OtpSegmentedPnlColumns.CompanyCode]
     )
+    if not company_codes:
+        return {}
 
-    stmt = select(models.CompanyCode)
-    existing = session.exec(stmt).all()
-    missing: List[models.CompanyCode] = []
-    for company_code in company_codes:
-        if company_code not in [c.code for c in existing]:
-            add = models.CompanyCode(code=company_code)
-            missing.append(add)
+    stmt = sqlite_insert(models.CompanyCode).values(
+        [{"code": cc} for cc in company_codes]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["code"], set_={"code": stmt.excluded.code}
+    ).returning(models.CompanyCode.id, models.CompanyCode.code)
 
-    session.add_all(missing)
+    mapping = {row.code: row.id for row in session.execute(stmt)}
     session.commit()
 
-    for company_code in missing:
-        session.refresh(company_code)
-
-    return {c.code: c.id for c in [*existing, *missing]}  # type:ignore
+    return mapping
 
 
 def prepare_line_items(
@@ -70,21 +117,20 @@ def prepare_line_items(
 ) -> Dict[str, int]:
     """Ensure line items exist; return mapping of name -> id."""
     unique_names = {name.strip() for name in line_item_names if name}
+    if not unique_names:
+        return {}
 
-    stmt = select(models.LineItem)
-    existing = session.exec(stmt).all()
-    missing: List[models.LineItem] = []
-    for line_item_name in unique_names:
-        if line_item_name not in [li.name for li in existing]:
-            missing.append(models.LineItem(name=line_item_name))
+    stmt = sqlite_insert(models.LineItem).values(
+        [{"name": name} for name in unique_names]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"], set_={"name": stmt.excluded.name}
+    ).returning(models.LineItem.id, models.LineItem.name)
 
-    session.add_all(missing)
+    mapping = {row.name: row.id for row in session.execute(stmt)}
     session.commit()
 
-    for line_item in missing:
-        session.refresh(line_item)
-
-    return {li.name: li.id for li in [*existing, *missing]}  # type:ignore
+    return mapping
 
 
 def build_load_context(
@@ -101,15 +147,31 @@ def build_load_context(
     return LoadContext(company_code_id=company_code_id, line_item_id=line_item_id)
 
 
-def _otp_high_level_line_item_map() -> Dict[str, str]:
-    return {
+def build_shared_load_context(
+    session: Session,
+    company_codes: Iterable[str],
+    line_item_names: Iterable[str],
+) -> LoadContext:
+    """Create one LoadContext covering the dimension values of several loaders."""
+    company_code_id = prepare_company_codes(session, company_codes)
+    line_item_id = prepare_line_items(
+        session,
+        [*line_item_names, *_otp_high_level_line_item_map().values()],
+    )
+    return LoadContext(company_code_id=company_code_id, line_item_id=line_item_id)
+
+
+@cache
+def _otp_high_level_line_item_map() -> Mapping[str, str]:
+    # Read-only so the cached instance is safe to share across threads.
+    return MappingProxyType({
         OtpSegmentedPnlColumns.Net_Sales_Total.value: HighLevelSegmentedPnlColumns.TotalNetSales.value,
         OtpSegmentedPnlColumns.Cogs.value: HighLevelSegmentedPnlColumns.Cogs.value,
         OtpSegmentedPnlColumns.Gross_Profit_Before_Variances.value: HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances.value,
         OtpSegmentedPnlColumns.Gross_Profit_After_Variances.value: HighLevelSegmentedPnlColumns.GrossProfitAfterVariances.value,
         OtpSegmentedPnlColumns.Total_SAR.value: HighLevelSegmentedPnlColumns.TotalSAR.value,
         OtpSegmentedPnlColumns.Ebit.value: HighLevelSegmentedPnlColumns.TotalEBIT.value,
-    }
+    })
 
 
 def load_otp_segmented_pnl(
@@ -120,49 +182,67 @@ def load_otp_segmented_pnl(
     table_model: Type[
         models.ProductBusinessSegmented
     ] = models.ProductBusinessSegmented,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load OTP segmented P&L data for all numeric columns."""
     logger.debug("load_otp_segmented_pnl_started", rows=len(df))
     line_item_map = _otp_high_level_line_item_map()
-    company_code_id = prepare_company_codes(
-        session, df[company_code_col].dropna().astype(str)
-    )
-    line_item_id = prepare_line_items(session, line_item_map.values())
-    ctx = LoadContext(company_code_id=company_code_id, line_item_id=line_item_id)
+    if ctx is None:
+        company_code_id = prepare_company_codes(
+            session, df[company_code_col].dropna().astype(str)
+        )
+        line_item_id = prepare_line_items(session, line_item_map.values())
+        ctx = LoadContext(company_code_id=company_code_id, line_item_id=line_item_id)
     numeric_cols = [
         *OtpSegmentedPnlColumns.list_numeric_cols(),
         *OtpSegmentedPnlColumns.list_percentage_cols(),
     ]
 
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        company_id = ctx.company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        category = None
-        if category_col:
-            category = None if pd.isna(row[category_col]) else str(row[category_col])  # type: ignore
-
-        for otp_col in numeric_cols:
-            line_item_name = line_item_map.get(otp_col, otp_col)
-            amount = _to_decimal(row.get(otp_col))
-            line_item_id = ctx.line_item_id.get(line_item_name)
+    id_vars = [company_code_col] if category_col is None else [company_code_col, category_col]
+    long_df = df.reindex(columns=[*id_vars, *numeric_cols]).melt(
+        id_vars=id_vars,
+        value_vars=numeric_cols,
+        var_name="otp_col",
+        value_name="amount",
+    )
 
-            rows.append(
-                table_model(
-                    company_code_id=company_id,
-                    line_item_name=line_item_name,
-                    line_item_id=line_item_id,
-                    category=category,
-                    amount=amount,
-                )
-            )
+    company_ids = _resolve_ids(long_df[company_code_col], ctx.company_code_id)
+    keep = company_ids.notna()
+    long_df = long_df[keep]
+
+    line_item_names = long_df["otp_col"].map(line_item_map).fillna(long_df["otp_col"])
+    item_ids = line_item_names.map(ctx.line_item_id)
+    if category_col:
+        categories = (
+            long_df[category_col]
+            .astype(str)
+            .where(long_df[category_col].notna(), None)
+            .to_numpy()
+        )
+    else:
+        categories = [None] * len(long_df)
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_name": line_item_name,
+            "line_item_id": None if pd.isna(item_id) else int(item_id),
+            "category": category,
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, line_item_name, item_id, category, amount in zip(
+            company_ids[keep].to_numpy(),
+            line_item_names.to_numpy(),
+            item_ids.to_numpy(),
+            categories,
+            long_df["amount"].to_numpy(),
+        )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_otp_segmented_pnl_finished", rows=rows_loaded)
     logger.info("load_otp_segmented_pnl_total", rows=rows_loaded)
     return rows_loaded
@@ -175,40 +255,41 @@ def load_grand_totals(
     line_item_col: str = SapBwColumns.PnlItem.value,
     amount_col: str = SapBwColumns.Amount.value,
     table_model: Type[models.GrandTotal] = models.GrandTotal,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load grand totals data."""
     logger.debug("load_grand_totals_started", rows=len(df))
-    company_code_id = prepare_company_codes(
-        session, df[company_code_col].dropna().astype(str)
-    )
-    line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
-    line_item_id = prepare_line_items(session, line_item_names)
-
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        company_id = company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        line_item_name = _line_item_label(row[line_item_col])
-        item_id = line_item_id.get(line_item_name)
-        if item_id is None:
-            continue
-
-        amount = _to_decimal(row[amount_col])
-
-        rows.append(
-            table_model(
-                company_code_id=company_id,
-                line_item_id=item_id,
-                amount=amount,
-            )
+    if ctx is None:
+        company_code_id = prepare_company_codes(
+            session, df[company_code_col].dropna().astype(str)
+        )
+        line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
+        line_item_id = prepare_line_items(session, line_item_names)
+    else:
+        company_code_id = ctx.company_code_id
+        line_item_id = ctx.line_item_id
+
+    company_ids = _resolve_ids(df[company_code_col], company_code_id)
+    item_ids = df[line_item_col].map(_line_item_label).map(line_item_id)
+    keep = company_ids.notna() & item_ids.notna()
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_id": int(item_id),
+            "amount_milli": amount_milli,
+        }
+        for company_id, item_id, amount_milli in zip(
+            company_ids[keep].to_numpy(),
+            item_ids[keep].to_numpy(),
+            _amounts_to_milli(df.loc[keep, amount_col]),
         )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_grand_totals_finished", rows=rows_loaded)
     logger.info("load_grand_totals_total", rows=rows_loaded)
     return rows_loaded
@@ -222,40 +303,41 @@ def load_rnd_service(
     amount_col: str = SapBwColumns.Amount.value,
     account_col: str = SapBwColumns.GlAccount.value,
     table_model: Type[models.RndService] = models.RndService,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load R&D services data."""
     logger.debug("load_rnd_service_started", rows=len(df))
-    company_code_id = prepare_company_codes(
-        session, df[company_code_col].dropna().astype(str)
-    )
-    line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
-    line_item_id = prepare_line_items(session, line_item_names)
-
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        company_id = company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        line_item_name = _line_item_label(row[line_item_col])
-        item_id = line_item_id.get(line_item_name)
-        if item_id is None:
-            continue
-
-        amount = _to_decimal(row[amount_col])
-
-        rows.append(
-            table_model(
-                company_code_id=company_id,
-                line_item_id=item_id,
-                amount=amount,
-            )
+    if ctx is None:
+        company_code_id = prepare_company_codes(
+            session, df[company_code_col].dropna().astype(str)
+        )
+        line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
+        line_item_id = prepare_line_items(session, line_item_names)
+    else:
+        company_code_id = ctx.company_code_id
+        line_item_id = ctx.line_item_id
+
+    company_ids = _resolve_ids(df[company_code_col], company_code_id)
+    item_ids = df[line_item_col].map(_line_item_label).map(line_item_id)
+    keep = company_ids.notna() & item_ids.notna()
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_id": int(item_id),
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, item_id, amount in zip(
+            company_ids[keep].to_numpy(),
+            item_ids[keep].to_numpy(),
+            df.loc[keep, amount_col].to_numpy(),
         )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_rnd_service_finished", rows=rows_loaded)
     logger.info("load_rnd_service_total", rows=rows_loaded)
     return rows_loaded
@@ -267,38 +349,41 @@ def load_shared_services_total_charge(
     table_model: Type[
         models.SharedServicesTotalCharge
     ] = models.SharedServicesTotalCharge,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load shared services total charges from pivoted GS charges data."""
     logger.debug("load_shared_services_total_charge_started", rows=len(df))
-    company_code_id = prepare_company_codes(session, [str(x) for x in df.index])
-    line_item_names = [_line_item_label(x) for x in df.columns]
-    line_item_id = prepare_line_items(session, line_item_names)
+    if ctx is None:
+        company_code_id = prepare_company_codes(session, [str(x) for x in df.index])
+        line_item_names = [_line_item_label(x) for x in df.columns]
+        line_item_id = prepare_line_items(session, line_item_names)
+    else:
+        company_code_id = ctx.company_code_id
+        line_item_id = ctx.line_item_id
+
+    company_ids = _resolve_ids(df.index.to_series(), company_code_id)
+    keep = company_ids.notna().to_numpy()
+    kept_company_ids = company_ids[keep].to_numpy()
 
     rows = []
-    for company_code, row in df.iterrows():
-        company_id = company_code_id.get(str(company_code).upper())
-        if company_id is None:
+    for col in df.columns:
+        item_id = line_item_id.get(_line_item_label(col))
+        if item_id is None:
             continue
 
-        for col in df.columns:
-            line_item_name = _line_item_label(col)
-            item_id = line_item_id.get(line_item_name)
-            if item_id is None:
-                continue
-
-            amount = _to_decimal(row[col])
-
+        for company_id, amount in zip(kept_company_ids, df.loc[keep, col].to_numpy()):
             rows.append(
-                table_model(
-                    company_code_id=company_id,
-                    line_item_id=item_id,
-                    amount=amount,
-                )
+                {
+                    "company_code_id": int(company_id),
+                    "line_item_id": item_id,
+                    "amount_milli": _to_milli(amount),
+                }
             )
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_shared_services_total_charge_finished", rows=rows_loaded)
     logger.info("load_shared_services_total_charge_total", rows=rows_loaded)
     return rows_loaded
@@ -314,42 +399,48 @@ def load_royalties(
     table_model: Type[
         models.IntellectualPropertyService
     ] = models.IntellectualPropertyService,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load intellectual property service (royalties) data."""
     logger.debug("load_royalties_started", rows=len(df))
-    company_code_id = prepare_company_codes(
-        session, df[company_code_col].dropna().astype(str)
+    if ctx is None:
+        company_code_id = prepare_company_codes(
+            session, df[company_code_col].dropna().astype(str)
+        )
+        line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
+        line_item_id = prepare_line_items(session, line_item_names)
+    else:
+        company_code_id = ctx.company_code_id
+        line_item_id = ctx.line_item_id
+
+    company_ids = _resolve_ids(df[company_code_col], company_code_id)
+    item_ids = df[line_item_col].map(_line_item_label).map(line_item_id)
+    keep = company_ids.notna() & item_ids.notna()
+    accounts = (
+        df.loc[keep, account_col].to_numpy()
+        if account_col in df.columns
+        else [None] * int(keep.sum())
     )
-    line_item_names = [_line_item_label(x) for x in df[line_item_col].dropna()]
-    line_item_id = prepare_line_items(session, line_item_names)
-
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        company_id = company_code_id.get(company_code)
-        if company_id is None:
-            continue
 
-        line_item_name = _line_item_label(row[line_item_col])
-        item_id = line_item_id.get(line_item_name)
-        if item_id is None:
-            continue
-
-        account_number = _to_int(row.get(account_col))
-        amount = _to_decimal(row[amount_col])
-
-        rows.append(
-            table_model(
-                company_code_id=company_id,
-                line_item_id=item_id,
-                account_number=account_number,
-                amount=amount,
-            )
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_id": int(item_id),
+            "account_number": _to_int(account),
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, item_id, account, amount in zip(
+            company_ids[keep].to_numpy(),
+            item_ids[keep].to_numpy(),
+            accounts,
+            df.loc[keep, amount_col].to_numpy(),
         )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_royalties_finished", rows=rows_loaded)
     logger.info("load_royalties_total", rows=rows_loaded)
     return rows_loaded
@@ -361,43 +452,55 @@ def load_otp_unsegmented_pnl(
     company_code_col: str = OtpSegmentedPnlColumns.CompanyCode.value,
     category_col: Optional[str] = OtpSegmentedPnlColumns.Category.value,
     table_model: Type[models.ProductBusiness] = models.ProductBusiness,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Load OTP unsegmented P&L data for all numeric columns."""
     logger.debug("load_otp_unsegmented_pnl_started", rows=len(df))
     line_item_map = _otp_high_level_line_item_map()
-    company_code_id = prepare_company_codes(
-        session, df[company_code_col].dropna().astype(str)
-    )
-    line_item_id = prepare_line_items(session, line_item_map.values())
+    if ctx is None:
+        company_code_id = prepare_company_codes(
+            session, df[company_code_col].dropna().astype(str)
+        )
+        line_item_id = prepare_line_items(session, line_item_map.values())
+        ctx = LoadContext(company_code_id=company_code_id, line_item_id=line_item_id)
     numeric_cols = [
         *OtpSegmentedPnlColumns.list_numeric_cols(),
         *OtpSegmentedPnlColumns.list_percentage_cols(),
     ]
 
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        company_id = company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        for otp_col in numeric_cols:
-            line_item_name = line_item_map.get(otp_col, otp_col)
-            amount = _to_decimal(row.get(otp_col))
-            item_id = line_item_id.get(line_item_name)
+    long_df = df.reindex(columns=[company_code_col, *numeric_cols]).melt(
+        id_vars=[company_code_col],
+        value_vars=numeric_cols,
+        var_name="otp_col",
+        value_name="amount",
+    )
 
-            rows.append(
-                table_model(
-                    company_code_id=company_id,
-                    line_item_name=line_item_name,
-                    line_item_id=item_id,
-                    amount=amount,
-                )
-            )
+    company_ids = _resolve_ids(long_df[company_code_col], company_code_id)
+    keep = company_ids.notna()
+    long_df = long_df[keep]
+
+    line_item_names = long_df["otp_col"].map(line_item_map).fillna(long_df["otp_col"])
+    item_ids = line_item_names.map(line_item_id)
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_name": line_item_name,
+            "line_item_id": None if pd.isna(item_id) else int(item_id),
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, line_item_name, item_id, amount in zip(
+            company_ids[keep].to_numpy(),
+            line_item_names.to_numpy(),
+            item_ids.to_numpy(),
+            long_df["amount"].to_numpy(),
+        )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_otp_unsegmented_pnl_finished", rows=rows_loaded)
     logger.info("load_otp_unsegmented_pnl_total", rows=rows_loaded)
     return rows_loaded
@@ -413,6 +516,8 @@ def load_segmented_pnl(
     table_model: Type[
         models.ProductBusinessSegmented
     ] = models.ProductBusinessSegmented,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Template loader for segmented P&L data.
 
@@ -420,37 +525,39 @@ def load_segmented_pnl(
     - Writes into ProductBusinessSegmented by default.
     """
     logger.debug("load_segmented_pnl_started", rows=len(df))
-    ctx = build_load_context(session, df, company_code_col, line_item_col)
-
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        line_item = str(row[line_item_col])
-        amount = _to_decimal(row[amount_col])
-
-        company_id = ctx.company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        line_item_id = ctx.line_item_id.get(line_item)
-
-        category = None
-        if category_col:
-            category = None if pd.isna(row[category_col]) else str(row[category_col])  # type: ignore
-
-        rows.append(
-            table_model(
-                company_code_id=company_id,
-                line_item_name=line_item,
-                line_item_id=line_item_id,
-                category=category,
-                amount=amount,
-            )
+    if ctx is None:
+        ctx = build_load_context(session, df, company_code_col, line_item_col)
+
+    company_ids = _resolve_ids(df[company_code_col], ctx.company_code_id)
+    keep = company_ids.notna()
+    line_item_names = df.loc[keep, line_item_col].astype(str)
+    item_ids = line_item_names.map(ctx.line_item_id)
+    if category_col:
+        cats = df.loc[keep, category_col]
+        categories = cats.astype(str).where(cats.notna(), None).to_numpy()
+    else:
+        categories = [None] * int(keep.sum())
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_name": line_item_name,
+            "line_item_id": None if pd.isna(item_id) else int(item_id),
+            "category": category,
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, line_item_name, item_id, category, amount in zip(
+            company_ids[keep].to_numpy(),
+            line_item_names.to_numpy(),
+            item_ids.to_numpy(),
+            categories,
+            df.loc[keep, amount_col].to_numpy(),
         )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_segmented_pnl_finished", rows=rows_loaded)
     logger.info("load_segmented_pnl_total", rows=rows_loaded)
     return rows_loaded
@@ -463,35 +570,37 @@ def load_unsegmented_pnl(
     line_item_col: str,
     amount_col: str,
     table_model: Type[models.ProductBusiness] = models.ProductBusiness,
+    ctx: Optional[LoadContext] = None,
+    commit: bool = True,
 ) -> int:
     """Template loader for unsegmented P&L data."""
     logger.debug("load_unsegmented_pnl_started", rows=len(df))
-    ctx = build_load_context(session, df, company_code_col, line_item_col)
-
-    rows = []
-    for _, row in df.iterrows():
-        company_code = str(row[company_code_col]).upper()
-        line_item = str(row[line_item_col])
-        amount = _to_decimal(row[amount_col])
-
-        company_id = ctx.company_code_id.get(company_code)
-        if company_id is None:
-            continue
-
-        line_item_id = ctx.line_item_id.get(line_item)
-
-        rows.append(
-            table_model(
-                company_code_id=company_id,
-                line_item_name=line_item,
-                line_item_id=line_item_id,
-                amount=amount,
-            )
+    if ctx is None:
+        ctx = build_load_context(session, df, company_code_col, line_item_col)
+
+    company_ids = _resolve_ids(df[company_code_col], ctx.company_code_id)
+    keep = company_ids.notna()
+    line_item_names = df.loc[keep, line_item_col].astype(str)
+    item_ids = line_item_names.map(ctx.line_item_id)
+
+    rows = [
+        {
+            "company_code_id": int(company_id),
+            "line_item_name": line_item_name,
+            "line_item_id": None if pd.isna(item_id) else int(item_id),
+            "amount_milli": _to_milli(amount),
+        }
+        for company_id, line_item_name, item_id, amount in zip(
+            company_ids[keep].to_numpy(),
+            line_item_names.to_numpy(),
+            item_ids.to_numpy(),
+            df.loc[keep, amount_col].to_numpy(),
         )
+    ]
 
-    session.add_all(rows)
-    session.commit()
-    rows_loaded = len(rows)
+    rows_loaded = _bulk_insert(session, table_model, rows)
+    if commit:
+        session.commit()
     logger.debug("load_unsegmented_pnl_finished", rows=rows_loaded)
     logger.info("load_unsegmented_pnl_total", rows=rows_loaded)
     return rows_loaded
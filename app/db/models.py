@@ -2,85 +2,155 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class CompanyCode(SQLModel, table=True):
     id: Optional[int] = Field(primary_key=True, default=None)
-    code: str = Field(index=True)
+    code: str = Field(index=True, unique=True)
 
 
 class LineItem(SQLModel, table=True):
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
-    name: str
+    name: str = Field(index=True, unique=True)
 
 
 class RndService(SQLModel, table=True):
+    # Covering index: the common (company, line item) aggregations are
+    # answered from index pages alone. Its leftmost prefix also serves
+    # company-only filters, so no single-column index on company_code_id.
+    __table_args__ = (
+        Index(
+            "ix_rndservice_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_id: int = Field(foreign_key="lineitem.id", index=True)
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
     created_on: Optional[datetime] = Field(index=True, default_factory=datetime.now)
 
 
 class SharedServicesTotalCharge(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_sharedservicestotalcharge_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_id: int = Field(foreign_key="lineitem.id", index=True, nullable=False)
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
     created_on: Optional[datetime] = Field(index=True, default_factory=datetime.now)
 
 
 class GrandTotal(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_grandtotal_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_id: int = Field(foreign_key="lineitem.id", index=True, nullable=False)
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
     created_on: Optional[datetime] = Field(index=True, default_factory=datetime.now)
 
 
 class IntellectualPropertyService(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_intellectualpropertyservice_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_id: int = Field(foreign_key="lineitem.id", index=True, nullable=False)
     account_number: int = Field(index=True)
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
 
 
 class ProductBusiness(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_productbusiness_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_name: str = Field(index=True)
     line_item_id: Optional[int] = Field(
         default=None, foreign_key="lineitem.id", index=True
     )
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
 
 
 class ProductBusinessSegmented(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_productbusinesssegmented_cc_li_amount",
+            "company_code_id",
+            "line_item_id",
+            "amount_milli",
+        ),
+    )
+
     id: Optional[int] = Field(primary_key=True, default=None, index=True)
 
-    company_code_id: int = Field(
-        foreign_key="companycode.id", index=True, nullable=False
-    )
+    company_code_id: int = Field(foreign_key="companycode.id", nullable=False)
     line_item_name: str = Field(index=True)
     line_item_id: Optional[int] = Field(
         default=None, foreign_key="lineitem.id", index=True
     )
     category: Optional[str] = None
-    amount: Decimal = Field(default=0, max_digits=5, decimal_places=3)
+    amount_milli: int = Field(default=0)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.amount_milli) / 1000
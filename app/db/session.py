@@ -1,24 +1,90 @@
 from contextlib import contextmanager
+from functools import lru_cache
 
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.config import app_config
 
+# Tuned for bulk ETL loads: WAL turns per-commit page fsyncs into
+# sequential log appends, and the larger cache/mmap keep the hot
+# B-tree pages in memory.
+_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
 
-def get_engine():
-    return create_engine(
-        f"sqlite:///{app_config.database_path}",
-        echo=app_config.db_echo,
+
+@lru_cache(maxsize=None)
+def _build_engine(database_path: str, echo: bool):
+    # One pool per (path, echo) pair so the warmed SQLite file handles
+    # survive across sessions while a config change still yields a
+    # fresh engine.
+    engine = create_engine(
+        f"sqlite:///{database_path}",
+        echo=echo,
+        pool_pre_ping=True,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _CONNECT_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _build_session_factory(engine):
+    # one sessionmaker per engine; configuring it per call would rebuild
+    # the identity-map plumbing on every session_scope entry
+    return scoped_session(
+        sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
     )
 
 
+def get_engine():
+    return _build_engine(str(app_config.database_path), app_config.db_echo)
+
+
+def _clear_engine_cache():
+    # let tests drop the pooled engines (and their session factories)
+    # between cases
+    _build_session_factory.cache_clear()
+    _build_engine.cache_clear()
+
+
+get_engine.cache_clear = _clear_engine_cache  # type: ignore[attr-defined]
+
+
 def create_db_and_tables():
     engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    with engine.connect() as connection:
+        # Refresh sqlite_stat1 so the planner picks the composite indexes.
+        connection.exec_driver_sql("ANALYZE")
 
 
 @contextmanager
 def session_scope():
-    engine = get_engine()
-    with Session(engine) as session:
+    # the loaders commit once per load; expire_on_commit=False keeps
+    # their instances live across that commit instead of re-SELECTing
+    factory = _build_session_factory(get_engine())
+    session = factory()
+    try:
         yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        factory.remove()
@@ -188,20 +188,27 @@ class OtpSegmentedPnlColumns(StrEnum):
     def list_added_cols(cls) -> List[str]:
         """Return a list of columns added by the pipeline for activity and category segmentation."""
         return [
-            cls.Activity,
-            cls.Category,
+            cls.Activity.value,
+            cls.Category.value,
         ]
 
     @classmethod
     def list_numeric_cols(cls) -> List[str]:
         """Return a list of numeric column names by excluding text, percentage, and added columns from all values."""
-        return [
-            col
-            for col in cls.list_values()
-            if col
-            not in [
-                *cls.list_text_cols(),
-                *cls.list_percentage_cols(),
-                *cls.list_added_cols(),
-            ]
+        return list(_OTP_NUMERIC_COLS)
+
+
+# Computed once at import so hot ETL paths don't rebuild the exclusion
+# lists on every call.
+_OTP_NUMERIC_COLS = tuple(
+    col
+    for col in OtpSegmentedPnlColumns.list_values()
+    if col
+    not in frozenset(
+        [
+            *OtpSegmentedPnlColumns.list_text_cols(),
+            *OtpSegmentedPnlColumns.list_percentage_cols(),
+            *OtpSegmentedPnlColumns.list_added_cols(),
         ]
+    )
+)
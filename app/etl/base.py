@@ -5,6 +5,52 @@ import pandas as pd
 
 from app.interfaces import EtlLoader
 
+try:
+    # calamine (Rust-backed) parses XLSX several times faster than openpyxl.
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None  # let pandas pick its default engine
+
+try:
+    # pyarrow multithreads the CSV parse and uses far less memory than
+    # the default C engine on wide files.
+    import pyarrow  # noqa: F401
+
+    _CSV_ENGINE: Optional[str] = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = None
+
+
+def read_dataframe(
+    fname: str | Path, sheet_name: Optional[str] = None, **kwargs
+) -> pd.DataFrame:
+    """Read a CSV or Excel file into a DataFrame with the preferred engines.
+
+    Module-level so callers with a bare file config can read directly
+    without constructing a throwaway BaseETL instance.
+    """
+    fname = Path(fname)
+
+    match fname.suffix:
+        case ".csv":
+            if _CSV_ENGINE is not None:
+                kwargs.setdefault("engine", _CSV_ENGINE)
+            df = pd.read_csv(fname, **kwargs)
+        case ".xlsx" | ".xls" | ".xlsb":
+            if _EXCEL_ENGINE is not None:
+                kwargs.setdefault("engine", _EXCEL_ENGINE)
+            df = (
+                pd.read_excel(fname, sheet_name=sheet_name, **kwargs)
+                if sheet_name
+                else pd.read_excel(fname, **kwargs)
+            )
+        case _:
+            raise ValueError(f"File extension - {fname.suffix} - not supported.")
+
+    return df
+
 
 class BaseETL(EtlLoader):
     """Base class for ETL operations, handling file loading and data standardization.
@@ -27,6 +73,7 @@ class BaseETL(EtlLoader):
         """
         self.fname = Path(fname)
         self.sheet_name = sheet_name
+        self._load_cache: dict[tuple, pd.DataFrame] = {}
 
     def load(self, **kwargs) -> pd.DataFrame:
         """Load data from the file specified in fname, supporting CSV and Excel formats.
@@ -42,21 +89,15 @@ class BaseETL(EtlLoader):
             Any exceptions raised by pandas read functions (e.g., FileNotFoundError).
         """
 
-        match self.fname.suffix:
-            case ".csv":
-                df = pd.read_csv(self.fname, **kwargs)
-            case ".xlsx" | ".xls":
-                df = (
-                    pd.read_excel(self.fname, sheet_name=self.sheet_name, **kwargs)
-                    if self.sheet_name
-                    else pd.read_excel(self.fname, **kwargs)
-                )
-            case _:
-                raise ValueError(
-                    f"File extension - {self.fname.suffix} - not supported."
-                )
-
-        return df
+        # repeated loads of the same sheet reuse the parsed frame; the
+        # shallow copy keeps callers' mutations off the cached original
+        key = tuple(sorted(kwargs.items()))
+        cached = self._load_cache.get(key)
+        if cached is None:
+            cached = read_dataframe(self.fname, self.sheet_name, **kwargs)
+            self._load_cache[key] = cached
+
+        return cached.copy(deep=False)
 
     def transform(self) -> pd.DataFrame:
         """Abstract method to perform data transformation on the loaded data.
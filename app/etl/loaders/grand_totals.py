@@ -5,13 +5,18 @@ import pandas as pd
 from app.enums import SapBwColumns
 
 from ..base import BaseETL
-from ..standardize import standardize_cols_to_str, standardize_legacy_columns
+from ..standardize import LEGACY_COLUMN_MAP, standardize_cols_to_str
 
 
 def transform_grand_totals_df(df: pd.DataFrame) -> pd.DataFrame:
-    dfc = df.copy()
-    cols = list(dfc.columns)
-    dfc = dfc.melt(id_vars=cols[:3], value_vars=cols[3:], var_name="values")
+    # drop the embedded header rows on the wide frame so melt never
+    # materializes them across the value columns
+    df = df.iloc[1:]
+    df = df[df.iloc[:, 0].astype(str) != "Company code"]
+
+    cols = list(df.columns)
+    # melt already allocates a new frame, so no entry copy is needed
+    dfc = df.melt(id_vars=cols[:3], value_vars=cols[3:], var_name="values")
 
     text_columns = [
         SapBwColumns.CompanyCode,
@@ -25,15 +30,11 @@ def transform_grand_totals_df(df: pd.DataFrame) -> pd.DataFrame:
 
     dfc.columns = columns
     dfc = standardize_cols_to_str(dfc, text_columns)
-    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].apply(
-        standardize_legacy_columns
-    )
-
-    # remove first row
-    dfc = dfc.iloc[1:]
-    dfc.reset_index(inplace=True, drop=True)
-
-    dfc = dfc[dfc[SapBwColumns.CompanyCode] != "Company code"]
+    pnl_items = dfc[SapBwColumns.PnlItem].map(LEGACY_COLUMN_MAP)
+    if pnl_items.isna().any():
+        invalid = dfc.loc[pnl_items.isna(), SapBwColumns.PnlItem].unique().tolist()
+        raise ValueError(f"Invalid column name: {invalid}")
+    dfc[SapBwColumns.PnlItem] = pnl_items
 
     return dfc
 
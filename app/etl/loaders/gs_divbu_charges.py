@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Sequence
+from typing import Dict, Optional, Sequence
 
 import pandas as pd
 
@@ -8,7 +8,6 @@ from app.enums import HighLevelSegmentedPnlColumns, SapBwColumns
 from app.interfaces import GsEtlLoader
 
 from ..base import BaseETL
-from ..standardize import standardize_cols_to_float, standardize_cols_to_str
 
 
 def transform_gs_divbu_charges_df(
@@ -31,23 +30,30 @@ def transform_gs_divbu_charges_df(
 
     columns = [*text_cols, *numeric_cols]
 
-    dfc = df.copy()
+    # shallow copy: copy-on-write keeps the caller's frame intact without
+    # duplicating the data blocks
+    dfc = df.copy(deep=False)
     dfc.columns = columns
 
-    dfc = standardize_cols_to_str(dfc, text_cols)
-    dfc = standardize_cols_to_float(dfc, numeric_cols)
+    # single astype pass over text and numeric columns
+    dfc = dfc.fillna({col: 0 for col in numeric_cols}).astype(
+        {
+            **{col: str for col in text_cols},
+            **{col: float for col in numeric_cols},
+        }
+    )
 
     dfc = dfc[dfc[SapBwColumns.GlAccount].isin(accounts)]
-    by = [SapBwColumns.CompanyCode, SapBwColumns.PnlItem]
-    dfc = dfc.groupby(by=by)[SapBwColumns.Amount].sum().reset_index()
-
-    if TYPE_CHECKING:
-        assert isinstance(dfc, pd.DataFrame)
 
+    # one hash-aggregate: pivot_table sums directly instead of a
+    # groupby().sum() followed by a second aggregation
     dfc = dfc.pivot_table(
         values=SapBwColumns.Amount,
         columns=SapBwColumns.PnlItem,
         index=SapBwColumns.CompanyCode,
+        aggfunc="sum",
+        observed=True,
+        fill_value=0,
     )
 
     dfc = dfc.rename(
@@ -59,8 +65,6 @@ def transform_gs_divbu_charges_df(
         }
     )
 
-    dfc = dfc.fillna(0)
-
     return dfc
 
 
@@ -75,6 +79,9 @@ class GsDivBuChargesETL(BaseETL, GsEtlLoader):
         self.data: pd.DataFrame | None = None
         self.config = config
         self.data_ok: Optional[pd.DataFrame] = None
+        self._pipeline_context: Optional[
+            Dict[str, Dict[HighLevelSegmentedPnlColumns, float]]
+        ] = None
 
     def load_data(self) -> pd.DataFrame:
         self.data = self.load()
@@ -84,19 +91,18 @@ class GsDivBuChargesETL(BaseETL, GsEtlLoader):
         dfc = df if df is not None else self.load_data()
         df_ok = transform_gs_divbu_charges_df(dfc, self.config.accounts_in_scope)
         self.data_ok = df_ok
+        self._pipeline_context = None
 
         return df_ok
 
     def generate_pipeline_context(
         self,
     ) -> Dict[str, Dict[HighLevelSegmentedPnlColumns, float]]:
-        ret = {}
-
-        assert isinstance(self.data_ok, pd.DataFrame)
-
-        records = self.data_ok.reset_index().to_dict(orient="records")
+        if self._pipeline_context is None:
+            assert isinstance(self.data_ok, pd.DataFrame)
 
-        for record in records:
-            ret[record[SapBwColumns.CompanyCode]] = record
+            # data_ok is pivoted on CompanyCode, so orient="index" keys the
+            # records without a reset_index/rebuild pass
+            self._pipeline_context = self.data_ok.to_dict(orient="index")
 
-        return ret
+        return self._pipeline_context
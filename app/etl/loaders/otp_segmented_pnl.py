@@ -1,29 +1,40 @@
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import List
 
+import numpy as np
 import pandas as pd
-from pandas._libs.missing import NAType
 
 from app.config import SegmentConfig
-from app.enums import Activity, Category, OtpSegmentedPnlColumns
-from app.etl.standardize import (
-    standardize_cols_to_float,
-    standardize_cols_to_str,
-    standardize_from_pct_to_float,
-)
+from app.enums import Category, OtpSegmentedPnlColumns
+from app.etl.standardize import standardize_from_pct_to_float
 
 from ..base import BaseETL
 
+# Plain-string bindings for the hot path: pandas compares column labels
+# and cell values as str, so skipping the enum descriptor lookups keeps
+# the per-frame work out of the Enum machinery.
+_CC_COL = OtpSegmentedPnlColumns.CompanyCode.value
+_SEGMENT_COL = OtpSegmentedPnlColumns.TPSegmentFinal.value
+_IC_FLAG_COL = OtpSegmentedPnlColumns.InterCompanyFlag.value
+_ACTIVITY_COL = OtpSegmentedPnlColumns.Activity.value
+_CATEGORY_COL = OtpSegmentedPnlColumns.Category.value
+_THIRD_PARTY_FLAG = "E"
+_CAT_OWN_MANUFACTURING_3P = Category.OwnManufacturingThirdParty.value
+
 
 def transform_otp_segmented_pnl_df(df: pd.DataFrame) -> pd.DataFrame:
-    dfc = df.copy()
     text_cols = OtpSegmentedPnlColumns.list_text_cols()
     percentage_cols = OtpSegmentedPnlColumns.list_percentage_cols()
     numeric_cols = OtpSegmentedPnlColumns.list_numeric_cols()
 
-    dfc = standardize_cols_to_str(dfc, text_cols)
-    dfc = standardize_cols_to_float(dfc, numeric_cols)
+    # one astype pass converts text and numeric columns together instead
+    # of looping column-by-column through the standardize helpers
+    dfc = df.fillna({col: 0 for col in numeric_cols}).astype(
+        {
+            **{col: str for col in text_cols},
+            **{col: float for col in numeric_cols},
+        }
+    )
     dfc = standardize_from_pct_to_float(dfc, percentage_cols)
 
     return dfc
@@ -32,36 +43,50 @@ def transform_otp_segmented_pnl_df(df: pd.DataFrame) -> pd.DataFrame:
 def enhance_otp_with_economic_activity(
     df: pd.DataFrame, rules: List[SegmentConfig]
 ) -> pd.DataFrame:
-    dfc = df.copy()
-
-    rules_dict: Dict[str, List[SegmentConfig]] = defaultdict(list)
-    for rule in rules:
-        rules_dict[rule.company_code].append(rule)
-
-    activity: List[Activity | NAType] = []
-    category: List[Category | NAType] = []
-
-    for _, row in dfc.iterrows():
-        company_code = row.get(OtpSegmentedPnlColumns.CompanyCode)
-        assert isinstance(company_code, str)
-
-        segment = row.get(OtpSegmentedPnlColumns.TPSegmentFinal)
-        is_third_party = row.get(OtpSegmentedPnlColumns.InterCompanyFlag) == "E"
-
-        for c in rules_dict.get(company_code.upper(), []):
-            if not is_third_party and c.category == Category.OwnManufacturingThirdParty:
-                continue
-
-            if c.segment == segment:
-                activity.append(c.activity)
-                category.append(c.category)
-                break
-        else:
-            activity.append(pd.NA)
-            category.append(pd.NA)
-
-    dfc[OtpSegmentedPnlColumns.Activity] = activity
-    dfc[OtpSegmentedPnlColumns.Category] = category
+    dfc = df.copy(deep=False)
+
+    rules_df = pd.DataFrame(
+        [
+            {
+                "_cc_upper": rule.company_code.upper(),
+                "_segment": rule.segment.value,
+                "_priority": priority,
+                "_activity": rule.activity,
+                "_category": rule.category,
+            }
+            for priority, rule in enumerate(rules)
+        ],
+        columns=["_cc_upper", "_segment", "_priority", "_activity", "_category"],
+    )
+
+    rows = pd.DataFrame(
+        {
+            "_row": np.arange(len(dfc)),
+            "_cc_upper": dfc[_CC_COL].astype("string").str.upper().to_numpy(),
+            "_segment": dfc[_SEGMENT_COL].to_numpy(),
+            "_third_party": (dfc[_IC_FLAG_COL] == _THIRD_PARTY_FLAG).to_numpy(),
+        }
+    )
+
+    matches = rows.merge(rules_df, on=["_cc_upper", "_segment"], how="inner")
+    # Third-party-only rules never apply to intercompany rows.
+    matches = matches[
+        matches["_third_party"]
+        | (matches["_category"] != _CAT_OWN_MANUFACTURING_3P)
+    ]
+    # First applicable rule per row wins, mirroring the rule declaration order.
+    matches = matches.sort_values(["_row", "_priority"]).drop_duplicates(
+        "_row", keep="first"
+    )
+
+    activity: np.ndarray = np.full(len(dfc), pd.NA, dtype=object)
+    category: np.ndarray = np.full(len(dfc), pd.NA, dtype=object)
+    matched_rows = matches["_row"].to_numpy()
+    activity[matched_rows] = matches["_activity"].to_numpy()
+    category[matched_rows] = matches["_category"].to_numpy()
+
+    dfc[_ACTIVITY_COL] = activity.tolist()
+    dfc[_CATEGORY_COL] = category.tolist()
 
     return dfc
 
@@ -91,4 +116,9 @@ class OtpSegmentedPnlETL(BaseETL):
         self, rules: List[SegmentConfig], df: pd.DataFrame | None = None
     ) -> pd.DataFrame:
         dfc = self.transform(df)
-        return enhance_otp_with_economic_activity(dfc, rules)
+        enhanced = enhance_otp_with_economic_activity(dfc, rules)
+        # transform leaves the numeric columns float64 but spread over
+        # the blocks created per astype; one copy consolidates them into
+        # a single contiguous block, so the handlers' to_numpy() calls
+        # downstream get zero-copy contiguous views
+        return enhanced.copy()
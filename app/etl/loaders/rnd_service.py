@@ -1,13 +1,55 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Sequence
 
+import numpy as np
 import pandas as pd
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 from app.config import RndServicesConfig
 from app.enums import HighLevelSegmentedPnlColumns, SapBwColumns
 from app.interfaces import EtlLoader
 
 from ..base import BaseETL
-from ..standardize import standardize_cols_to_str, standardize_legacy_columns
+from ..standardize import LEGACY_COLUMN_MAP, standardize_cols_to_str
+
+# Hoisted out of the .map callbacks: the per-row lambdas rebuilt these
+# dicts for every element. Mapping with .get keeps misses as None.
+_FR09_PNL_MAP = {
+    "EBIT": HighLevelSegmentedPnlColumns.TotalEBIT,
+    "TOTAL COGS (3rd PARTIES + GC)": HighLevelSegmentedPnlColumns.Cogs,
+    "TOTAL GROSS PROFIT AFTER VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitAfterVariances,
+    "TOTAL GROSS PROFIT BEFORE VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances,
+    "TOTAL NET SALES": HighLevelSegmentedPnlColumns.TotalNetSales,
+    "TOTAL SAR": HighLevelSegmentedPnlColumns.TotalSAR,
+}
+
+_DE03_PNL_MAP = {
+    **_FR09_PNL_MAP,
+    "OH Research & Development": HighLevelSegmentedPnlColumns.TotalSAR,
+}
+
+
+def _and_masks(*terms: np.ndarray) -> np.ndarray:
+    """AND boolean terms into one mask without materializing intermediates.
+
+    numexpr fuses the whole expression in a single pass when available;
+    the fallback folds the terms in place with np.logical_and.
+    """
+    if numexpr is not None:
+        expr = " & ".join(f"t{i}" for i in range(len(terms)))
+        return numexpr.evaluate(
+            expr, local_dict={f"t{i}": term for i, term in enumerate(terms)}
+        )
+
+    mask = terms[0].copy()
+    for term in terms[1:]:
+        np.logical_and(mask, term, out=mask)
+    return mask
 
 
 def transform_rnd_fr09_df(
@@ -26,40 +68,39 @@ def transform_rnd_fr09_df(
 
     columns = [*text_columns, *value_columns]
 
-    dfc = df.copy()
+    dfc = df.copy(deep=False)
     dfc.columns = columns
 
     dfc = standardize_cols_to_str(dfc, text_columns)
-    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].apply(
-        standardize_legacy_columns
-    )
+    pnl_items = dfc[SapBwColumns.PnlItem].map(LEGACY_COLUMN_MAP)
+    if pnl_items.isna().any():
+        invalid = dfc.loc[pnl_items.isna(), SapBwColumns.PnlItem].unique().tolist()
+        raise ValueError(f"Invalid column name: {invalid}")
+    dfc[SapBwColumns.PnlItem] = pnl_items
 
     if accounts_in_scope:
-        dfc = dfc[dfc[SapBwColumns.GlAccount].isin(accounts_in_scope)]
+        # hash the scope set once up front; membership tests then hit a
+        # frozenset instead of rebuilding a lookup per call
+        accounts_set = frozenset(accounts_in_scope)
+        dfc = dfc.loc[dfc[SapBwColumns.GlAccount].isin(accounts_set).to_numpy()]
 
     if TYPE_CHECKING:
         assert isinstance(dfc, pd.DataFrame)
 
+    # group over category codes instead of hashing strings per row; the
+    # aggregated frame is small, so restoring the dtypes after is cheap
+    key_columns = [SapBwColumns.CompanyCode, SapBwColumns.PnlItem]
+    dfc = dfc.astype({col: "category" for col in key_columns})
+
     dfc = (
-        dfc.groupby(
-            by=[
-                SapBwColumns.CompanyCode,
-                SapBwColumns.PnlItem,
-            ]
-        )[SapBwColumns.Amount]
+        dfc.groupby(by=key_columns, observed=True)[SapBwColumns.Amount]
         .sum()
         .reset_index()
     )
 
-    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].map(
-        lambda x: {
-            "EBIT": HighLevelSegmentedPnlColumns.TotalEBIT,
-            "TOTAL COGS (3rd PARTIES + GC)": HighLevelSegmentedPnlColumns.Cogs,
-            "TOTAL GROSS PROFIT AFTER VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitAfterVariances,
-            "TOTAL GROSS PROFIT BEFORE VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances,
-            "TOTAL NET SALES": HighLevelSegmentedPnlColumns.TotalNetSales,
-            "TOTAL SAR": HighLevelSegmentedPnlColumns.TotalSAR,
-        }.get(x)
+    dfc[SapBwColumns.CompanyCode] = dfc[SapBwColumns.CompanyCode].astype(str)
+    dfc[SapBwColumns.PnlItem] = (
+        dfc[SapBwColumns.PnlItem].astype(object).map(_FR09_PNL_MAP.get)
     )
 
     if TYPE_CHECKING:
@@ -90,35 +131,33 @@ def transform_rnd_de03_df(
 
     columns = [*text_columns, *value_columns]
 
-    dfc = df.copy()
+    dfc = df.copy(deep=False)
     dfc.columns = columns
 
     dfc = standardize_cols_to_str(dfc, text_columns)
 
-    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].map(
-        lambda x: {
-            "EBIT": HighLevelSegmentedPnlColumns.TotalEBIT,
-            "TOTAL COGS (3rd PARTIES + GC)": HighLevelSegmentedPnlColumns.Cogs,
-            "TOTAL GROSS PROFIT AFTER VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitAfterVariances,
-            "TOTAL GROSS PROFIT BEFORE VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances,
-            "TOTAL NET SALES": HighLevelSegmentedPnlColumns.TotalNetSales,
-            "TOTAL SAR": HighLevelSegmentedPnlColumns.TotalSAR,
-            "OH Research & Development": HighLevelSegmentedPnlColumns.TotalSAR,
-        }.get(x)
-    )
+    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].map(_DE03_PNL_MAP.get)
 
-    accounts = accounts_in_scope if accounts_in_scope else []
+    accounts = frozenset(accounts_in_scope) if accounts_in_scope else frozenset()
 
-    revenue: float = dfc[  # type:ignore
-        (dfc[SapBwColumns.ProfitCenter] == "7")
-        & (dfc[SapBwColumns.PnlItem] == HighLevelSegmentedPnlColumns.TotalNetSales)
-        & (dfc[SapBwColumns.GlAccount].isin(accounts))
-    ][SapBwColumns.Amount].sum()
+    # materialize the shared columns once and build both masks from the
+    # same ndarrays instead of re-slicing the frame per aggregate
+    profit_centers = dfc[SapBwColumns.ProfitCenter].to_numpy()
+    pnl_items = dfc[SapBwColumns.PnlItem].to_numpy()
+    amounts = dfc[SapBwColumns.Amount].to_numpy()
 
-    sar_cost: float = dfc[  # type:ignore
-        (dfc[SapBwColumns.ProfitCenter] == "39")
-        & (dfc[SapBwColumns.PnlItem] == HighLevelSegmentedPnlColumns.TotalSAR)
-    ][SapBwColumns.Amount].sum()
+    revenue_mask = _and_masks(
+        profit_centers == "7",
+        pnl_items == HighLevelSegmentedPnlColumns.TotalNetSales,
+        dfc[SapBwColumns.GlAccount].isin(accounts).to_numpy(),
+    )
+    sar_mask = _and_masks(
+        profit_centers == "39",
+        pnl_items == HighLevelSegmentedPnlColumns.TotalSAR,
+    )
+
+    revenue: float = amounts[revenue_mask].sum()
+    sar_cost: float = amounts[sar_mask].sum()
 
     rows = [
         HighLevelSegmentedPnlColumns.TotalNetSales,
@@ -157,8 +196,11 @@ class RndServiceETL(EtlLoader):
         data: The raw loaded DataFrame before transformation.
     """
 
-    def __init__(self, configs: Sequence[RndServicesConfig]) -> None:
+    def __init__(
+        self, configs: Sequence[RndServicesConfig], max_workers: int | None = None
+    ) -> None:
         self.configs = configs
+        self.max_workers = max_workers
 
     def transform_fr09(
         self, conf: RndServicesConfig, df: pd.DataFrame | None = None
@@ -198,16 +240,31 @@ class RndServiceETL(EtlLoader):
 
         return transform_rnd_de03_df(df, conf.company_code, conf.accounts_in_scope)
 
+    def _transform_one(self, conf: RndServicesConfig) -> pd.DataFrame | None:
+        match conf.company_code:
+            case "DE03":
+                return self.transform_de03(conf)
+            case "FR09":
+                return self.transform_fr09(conf)
+        return None
+
     def transform(self) -> pd.DataFrame:
-        df = pd.DataFrame()
-
-        for conf in self.configs:
-            df_ok = pd.DataFrame()
-            match conf.company_code:
-                case "DE03":
-                    df_ok = self.transform_de03(conf)
-                case "FR09":
-                    df_ok = self.transform_fr09(conf)
-            df = pd.concat([df, df_ok], axis=0)
-
-        return df
+        if not self.configs:
+            return pd.DataFrame()
+
+        # each config reads and aggregates an independent file, so they
+        # run on a thread pool; concatenation still happens exactly once
+        max_workers = self.max_workers or min(
+            len(self.configs), os.cpu_count() or 1
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = [
+                frame
+                for frame in executor.map(self._transform_one, self.configs)
+                if frame is not None
+            ]
+
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, axis=0, ignore_index=True)
@@ -5,7 +5,7 @@ import pandas as pd
 
 from app.config import RoyaltiesConfig
 from app.enums import SapBwColumns
-from app.etl.standardize import standardize_cols_to_str, standardize_legacy_columns
+from app.etl.standardize import LEGACY_COLUMN_MAP, standardize_cols_to_str
 
 from ..base import BaseETL
 
@@ -26,31 +26,43 @@ def transform_royalties_df(df: pd.DataFrame, accounts: Sequence[str]) -> pd.Data
 
     columns = [*text_columns, *value_columns]
 
-    dfc = df.copy()
+    dfc = df.copy(deep=False)
     dfc.columns = columns
 
     dfc = standardize_cols_to_str(dfc, text_columns)
-    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].apply(
-        standardize_legacy_columns
-    )
+    pnl_items = dfc[SapBwColumns.PnlItem].map(LEGACY_COLUMN_MAP)
+    if pnl_items.isna().any():
+        invalid = dfc.loc[pnl_items.isna(), SapBwColumns.PnlItem].unique().tolist()
+        raise ValueError(f"Invalid column name: {invalid}")
+    dfc[SapBwColumns.PnlItem] = pnl_items
 
-    dfc = dfc[dfc[SapBwColumns.GlAccount].isin(accounts)]
+    # hash the scope set once up front; membership tests then hit a
+    # frozenset instead of rebuilding a lookup per call
+    accounts_set = frozenset(accounts)
+    dfc = dfc.loc[dfc[SapBwColumns.GlAccount].isin(accounts_set).to_numpy()]
 
     if TYPE_CHECKING:
         assert isinstance(dfc, pd.DataFrame)
 
+    # group over category codes instead of hashing strings per row; the
+    # aggregated frame is small, so restoring the dtypes after is cheap
+    key_columns = [
+        SapBwColumns.PnlItem,
+        SapBwColumns.CompanyCode,
+        SapBwColumns.GlAccount,
+    ]
+    dfc = dfc.astype({col: "category" for col in key_columns})
+
     dfc = (
-        dfc.groupby(
-            by=[
-                SapBwColumns.PnlItem,
-                SapBwColumns.CompanyCode,
-                SapBwColumns.GlAccount,
-            ]
-        )[SapBwColumns.Amount]
+        dfc.groupby(by=key_columns, observed=True)[SapBwColumns.Amount]
         .sum()
         .reset_index()
     )
 
+    dfc[SapBwColumns.PnlItem] = dfc[SapBwColumns.PnlItem].astype(str)
+    dfc[SapBwColumns.CompanyCode] = dfc[SapBwColumns.CompanyCode].astype(str)
+    dfc[SapBwColumns.GlAccount] = dfc[SapBwColumns.GlAccount].astype(str)
+
     if TYPE_CHECKING:
         assert isinstance(dfc, pd.DataFrame)
 
@@ -1,42 +1,37 @@
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
 from app.enums import HighLevelSegmentedPnlColumns, SapBwColumns
 
 
-def standardize_legacy_columns(value: str) -> HighLevelSegmentedPnlColumns:
-    match value:
-        case "TOTAL NET SALES":
-            return HighLevelSegmentedPnlColumns.TotalNetSales
-
-        case "EBIT":
-            return HighLevelSegmentedPnlColumns.TotalEBIT
-
-        case "TOTAL GROSS PROFIT BEFORE VARIANCES":
-            return HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances
-
-        case "TOTAL GROSS PROFIT AFTER VARIANCES":
-            return HighLevelSegmentedPnlColumns.GrossProfitAfterVariances
+# Lookup table for legacy SAP BW column names; usable directly with
+# Series.map on hot paths.
+LEGACY_COLUMN_MAP = {
+    "TOTAL NET SALES": HighLevelSegmentedPnlColumns.TotalNetSales,
+    "EBIT": HighLevelSegmentedPnlColumns.TotalEBIT,
+    "TOTAL GROSS PROFIT BEFORE VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitBeforeVariances,
+    "TOTAL GROSS PROFIT AFTER VARIANCES": HighLevelSegmentedPnlColumns.GrossProfitAfterVariances,
+    "TOTAL SAR": HighLevelSegmentedPnlColumns.TotalSAR,
+    "TOTAL OPERATIONAL INCOME": HighLevelSegmentedPnlColumns.OpertionalIncome,
+    "TOTAL COGS (3rd PARTIES + GC)": HighLevelSegmentedPnlColumns.Cogs,
+}
 
-        case "TOTAL SAR":
-            return HighLevelSegmentedPnlColumns.TotalSAR
 
-        case "TOTAL OPERATIONAL INCOME":
-            return HighLevelSegmentedPnlColumns.OpertionalIncome
-
-        case "TOTAL COGS (3rd PARTIES + GC)":
-            return HighLevelSegmentedPnlColumns.Cogs
-
-        case _:
-            raise ValueError(f"Invalid column name: {value}")
+def standardize_legacy_columns(value: str) -> HighLevelSegmentedPnlColumns:
+    try:
+        return LEGACY_COLUMN_MAP[value]
+    except KeyError:
+        raise ValueError(f"Invalid column name: {value}") from None
 
 
 def standardize_cols_to_str(
     df: pd.DataFrame, columns: Sequence[SapBwColumns | str]
 ) -> pd.DataFrame:
     """Standardize specified columns in the DataFrame to string type."""
-    dfc = df.copy()
+    # shallow copy: copy-on-write protects the caller without a memcpy
+    dfc = df.copy(deep=False)
 
     ok = all([col in dfc.columns for col in columns])
 
@@ -50,17 +45,22 @@ def standardize_cols_to_str(
 
         raise KeyError(err_msg)
 
-    for col in columns:
-        dfc[col] = dfc[col].astype(str)
+    # one batched astype rebuilds the blocks in a single pass instead of
+    # re-consolidating per column; already-string columns are left alone
+    columns_to_cast = [
+        col for col in columns if not pd.api.types.is_string_dtype(dfc[col])
+    ]
+    if not columns_to_cast:
+        return dfc
 
-    return dfc
+    return dfc.astype({col: str for col in columns_to_cast})
 
 
 def standardize_cols_to_float(
     df: pd.DataFrame, columns: Sequence[SapBwColumns | str]
 ) -> pd.DataFrame:
     """Standardize specified columns in the DataFrame to float type."""
-    dfc = df.copy()
+    dfc = df.copy(deep=False)
 
     ok = all([col in dfc.columns for col in columns])
 
@@ -74,22 +74,33 @@ def standardize_cols_to_float(
 
         raise KeyError(err_msg)
 
-    for col in columns:
-        try:
-            dfc[col] = dfc[col].fillna(0).astype(float)
-        except ValueError as e:
-            raise ValueError(
-                f"[Numeric Standarizing] Column - `{col}` - failed to be transformed"
-            ) from e
-
-    return dfc
+    # already-float columns only need their NaNs filled, not a recast
+    columns_to_cast = [
+        col for col in columns if not pd.api.types.is_float_dtype(dfc[col])
+    ]
+
+    try:
+        dfc = dfc.fillna({col: 0 for col in columns})
+        if not columns_to_cast:
+            return dfc
+        return dfc.astype({col: float for col in columns_to_cast})
+    except ValueError:
+        # rerun per column only to name the offender in the error message
+        for col in columns:
+            try:
+                dfc[col].fillna(0).astype(float)
+            except ValueError as e:
+                raise ValueError(
+                    f"[Numeric Standarizing] Column - `{col}` - failed to be transformed"
+                ) from e
+        raise
 
 
 def standardize_from_pct_to_float(
     df: pd.DataFrame, columns: Sequence[str]
 ) -> pd.DataFrame:
     """Convert percentage columns from string format (e.g., '50%') to float (0.5)."""
-    dfc = df.copy()
+    dfc = df.copy(deep=False)
     ok = all([col in dfc.columns for col in columns])
 
     if not ok:
@@ -103,8 +114,16 @@ def standardize_from_pct_to_float(
         raise KeyError(err_msg)
 
     for col in columns:
-        dfc[col] = (
-            dfc[col].fillna("0%").astype(str).str.replace("%", "").astype(float) / 100
+        # single pass over the raw array instead of chaining
+        # fillna/astype/str.replace/astype, each of which allocates a
+        # full new Series
+        if pd.api.types.is_numeric_dtype(dfc[col]):
+            dfc[col] = dfc[col].fillna(0) / 100
+            continue
+        values = dfc[col].to_numpy()
+        cleaned = np.char.rstrip(
+            np.where(pd.isna(values), "0%", values).astype("U"), "%"
         )
+        dfc[col] = cleaned.astype(np.float64) / 100
 
     return dfc
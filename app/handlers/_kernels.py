@@ -0,0 +1,88 @@
+"""Numeric kernels for the handler allocation hot path.
+
+numba is an optional accelerator: when it is importable the kernels
+below are JIT-compiled and thread-parallel, otherwise equivalent NumPy
+fallbacks are used. The fallbacks are always defined so the two paths
+can be checked against each other; the jitted loops avoid fastmath so
+their results stay bit-identical to the fallbacks.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _allocate_proportional_numpy(
+    out: np.ndarray,
+    base: np.ndarray,
+    positions: np.ndarray,
+    scale: float,
+) -> None:
+    out[positions] += scale * base[positions]
+
+
+def _adjust_sar_numpy(
+    sm_oh: np.ndarray,
+    oh_adm: np.ndarray,
+    rt_oh: np.ndarray,
+    total_sar: np.ndarray,
+    positions: np.ndarray,
+    scale: float,
+) -> None:
+    sm_oh[positions] *= scale
+    oh_adm[positions] *= scale
+    rt_oh[positions] *= scale
+    total_sar[positions] = (
+        sm_oh[positions] + oh_adm[positions] + rt_oh[positions]
+    )
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def allocate_proportional(
+        out: np.ndarray,
+        base: np.ndarray,
+        positions: np.ndarray,
+        scale: float,
+    ) -> None:
+        for k in numba.prange(positions.shape[0]):
+            i = positions[k]
+            out[i] += scale * base[i]
+
+    @numba.njit(cache=True, parallel=True)
+    def adjust_sar(
+        sm_oh: np.ndarray,
+        oh_adm: np.ndarray,
+        rt_oh: np.ndarray,
+        total_sar: np.ndarray,
+        positions: np.ndarray,
+        scale: float,
+    ) -> None:
+        for k in numba.prange(positions.shape[0]):
+            i = positions[k]
+            sm_oh[i] *= scale
+            oh_adm[i] *= scale
+            rt_oh[i] *= scale
+            total_sar[i] = sm_oh[i] + oh_adm[i] + rt_oh[i]
+
+    # prime the JITs at import so the first real allocation skips the
+    # compile cost
+    allocate_proportional(
+        np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64), 0.0
+    )
+    adjust_sar(
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1),
+        np.zeros(1, dtype=np.int64),
+        0.0,
+    )
+
+else:
+    allocate_proportional = _allocate_proportional_numpy
+    adjust_sar = _adjust_sar_numpy
@@ -26,6 +26,20 @@ class AdminHandler(BaseHandler):
         df: The input DataFrame containing P&L data.
     """
 
+    # built once at class scope; __init__ only adds the target column
+    _REQUIRED_DF_COLS = frozenset(
+        {
+            OtpSegmentedPnlColumns.Category,
+            OtpSegmentedPnlColumns.Net_Sales_Total,
+        }
+    )
+    _REQUIRED_ROYALTY_COLS = frozenset(
+        {
+            SapBwColumns.CompanyCode,
+            SapBwColumns.Amount,
+        }
+    )
+
     def __init__(
         self,
         df: pd.DataFrame,
@@ -36,6 +50,7 @@ class AdminHandler(BaseHandler):
         ] = OtpSegmentedPnlColumns.OH_Administration,
         isin: Optional[List[Category]] = ISIN,
         filter_func: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+        royalty_expense_by_company: Optional[dict] = None,
     ) -> None:
         super().__init__(df, column, isin, filter_func)
 
@@ -46,12 +61,9 @@ class AdminHandler(BaseHandler):
             company_code=company_code,
         )
 
-        required_df_cols = [
-            OtpSegmentedPnlColumns.Category,
-            OtpSegmentedPnlColumns.Net_Sales_Total,
-            column,
-        ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        missing_df_cols = sorted(
+            (self._REQUIRED_DF_COLS | {column}).difference(df.columns)
+        )
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
@@ -63,13 +75,9 @@ class AdminHandler(BaseHandler):
                 "company_code and df_royalty must be provided"
             )
 
-            required_royalty_cols = [
-                SapBwColumns.CompanyCode,
-                SapBwColumns.Amount,
-            ]
-            missing_royalty_cols = [
-                col for col in required_royalty_cols if col not in df_royalty.columns
-            ]
+            missing_royalty_cols = sorted(
+                self._REQUIRED_ROYALTY_COLS.difference(df_royalty.columns)
+            )
             if missing_royalty_cols:
                 raise KeyError(
                     f"Missing required columns in df_royalty for {self.__class__.__name__}: {missing_royalty_cols}"
@@ -78,85 +86,100 @@ class AdminHandler(BaseHandler):
 
         self.df_royalty: pd.DataFrame = df_royalty  # type: ignore
         self.company_code: str = company_code  # type: ignore
+        self.royalty_expense_by_company = royalty_expense_by_company
 
         self.royalty_expense = self._get_royalty_expense() if enhance else 0.0
 
     def _get_royalty_expense(self) -> float:
-        self.logger.debug(
-            "royalty_expense_calculation_started",
-            handler=type(self).__name__,
-            company_code=self.company_code,
-        )
-        df = self.df_royalty
-        df = df[
-            (df[SapBwColumns.CompanyCode] == self.company_code)
-            & (df[SapBwColumns.Amount] < 0)
-        ]
-
-        if df.empty:
-            result = 0.0
+        if self._debug_enabled:
+            self.logger.debug(
+                "royalty_expense_calculation_started",
+                handler=type(self).__name__,
+                company_code=self.company_code,
+            )
+        if self.royalty_expense_by_company is not None:
+            # per-company scalar derived once upstream; falls back to
+            # scanning the royalty frame when the lookup is not supplied
+            result = self.royalty_expense_by_company.get(self.company_code, 0.0)
         else:
-            result = df[SapBwColumns.Amount].iloc[0]  # type:ignore
+            df = self.df_royalty
+            df = df[
+                (df[SapBwColumns.CompanyCode] == self.company_code)
+                & (df[SapBwColumns.Amount] < 0)
+            ]
 
-        self.logger.debug(
-            "royalty_expense_calculated",
-            handler=type(self).__name__,
-            royalty_expense=result,
-        )
+            if df.empty:
+                result = 0.0
+            else:
+                # raw buffer read instead of the iloc indexer
+                # machinery for a single scalar
+                result = df[SapBwColumns.Amount].to_numpy()[0]  # type:ignore
+
+        if self._debug_enabled:
+            self.logger.debug(
+                "royalty_expense_calculated",
+                handler=type(self).__name__,
+                royalty_expense=result,
+            )
         return result
 
     def allocate_to_line_items_by_net_sales(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
+        relevant_positions = self._get_relevant_positions()
 
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_net_sales_total()
         target_total = self.get_target_total()
         target_total -= self.royalty_expense
 
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
-
-        if base_total == 0:
+        if self._debug_enabled:
             self.logger.debug(
-                "allocation_skipped",
+                "allocation_totals_computed",
                 handler=type(self).__name__,
-                reason="base_zero",
+                base_total=base_total,
+                target_total=target_total,
             )
+
+        if base_total == 0:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="base_zero",
+                )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Net_Sales_Total,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_net_sales()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply administrative overhead allocation to the DataFrame.
@@ -1,11 +1,23 @@
+import logging
 from typing import Callable, List, Optional
 
+import numpy as np
 import pandas as pd
 from structlog import contextvars
 
 from app.enums import Activity, Category, OtpSegmentedPnlColumns
+from app.handlers._kernels import allocate_proportional
 from app.interfaces import SegmentationHandler
 
+# Plain-string bindings for the columns the handlers touch per process();
+# resolved once at import instead of per frame access (same pattern as
+# the OTP loader).
+_CC_COL = OtpSegmentedPnlColumns.CompanyCode.value
+_ACTIVITY_COL = OtpSegmentedPnlColumns.Activity.value
+_CATEGORY_COL = OtpSegmentedPnlColumns.Category.value
+_NET_SALES_COL = OtpSegmentedPnlColumns.Net_Sales_Total.value
+_COGS_COL = OtpSegmentedPnlColumns.Cogs.value
+
 
 class BaseHandler(SegmentationHandler):
     """Base class for segmentation handlers in the OTP pipeline.
@@ -23,7 +35,6 @@ class BaseHandler(SegmentationHandler):
         column: Optional specific column (OtpSegmentedPnlColumns) targeted for allocation.
         isin: List of Category enums used to filter relevant rows for totals calculation.
         filter_func: Optional callable for custom row filtering logic.
-        df_unallocated: Subset of df containing rows where Activity is NaN (unallocated items).
     """
 
     def __init__(
@@ -33,6 +44,7 @@ class BaseHandler(SegmentationHandler):
         isin: Optional[List[Category]] = None,
         filter_func: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
         company_code: Optional[str] = None,
+        cat_mask: Optional[np.ndarray] = None,
     ) -> None:
         """
         Initialize the BaseHandler instance with the DataFrame and configuration parameters.
@@ -46,48 +58,143 @@ class BaseHandler(SegmentationHandler):
             isin: Optional list of Category values to filter rows for total calculations.
             filter_func: Optional callable that takes a DataFrame and returns a boolean Series
                         to filter rows for allocation. If provided, this overrides the isin filter.
+            cat_mask: Optional precomputed boolean mask over the frame's rows. When the
+                        caller already scanned the Category column it is reused here
+                        instead of rebuilding the isin mask per handler.
         """
         self.df = df
+        # checked once so debug-only log calls skip the structlog
+        # processor chain entirely when debug logging is off
+        self._debug_enabled = logging.getLogger(
+            type(self).__module__
+        ).isEnabledFor(logging.DEBUG)
+        # handlers only ever read Category, so the column is stored as
+        # categorical once and membership tests run on integer codes
+        if _CATEGORY_COL in df.columns and not isinstance(
+            df[_CATEGORY_COL].dtype, pd.CategoricalDtype
+        ):
+            self.df[_CATEGORY_COL] = self.df[
+                _CATEGORY_COL
+            ].astype("category")
         self.column = column
         self.isin = [] if not isin else isin
         self.filter_func = filter_func
+        self._cat_mask = cat_mask
         self.company_code = company_code
         if (
             self.company_code is None
-            and OtpSegmentedPnlColumns.CompanyCode in df.columns
+            and _CC_COL in df.columns
         ):
-            uniqs = df[OtpSegmentedPnlColumns.CompanyCode].dropna().unique()
+            uniqs = df[_CC_COL].dropna().unique()
             if len(uniqs) == 1:
                 self.company_code = str(uniqs[0])
         if self.company_code is not None:
             contextvars.bind_contextvars(company_code=self.company_code)
-        self.df_unallocated = self._get_unallocated_line_items()
-
-    def _get_unallocated_line_items(self) -> pd.DataFrame:
-        """Extract rows from the DataFrame where Activity is NaN, representing unallocated items.
+        # the frame's shape doesn't change over a handler's lifetime, so
+        # the mask is computed once instead of per totals/unallocated call
+        self._relevant_mask = self._compute_relevant_rows_mask()
+        # per-column NumPy buffers, fetched lazily and reused so the hot
+        # path crosses the pandas boundary once per column, not per call,
+        # plus memoized scalar totals invalidated alongside them
+        self._col_cache: dict = {}
+        self._total_cache: dict = {}
+        # kept apart from _total_cache: the column enums are str-valued,
+        # so keying the unallocated sum by self.column would collide with
+        # the mask-based total of the same column
+        self._target_total: Optional[float] = None
+        # integer positions of the unallocated rows, resolved once so
+        # deallocate/get_target_total skip repeated label lookups
+        self._unalloc_pos = self._get_unallocated_positions()
+        self._relevant_pos: Optional[np.ndarray] = None
+
+    def _get_unallocated_positions(self) -> np.ndarray:
+        """Find rows where Activity is NaN, representing unallocated items.
+
+        Only the row positions are needed downstream, so no sub-frame is
+        materialized.
 
         Returns:
-            A filtered DataFrame containing only unallocated line items.
+            Integer positions of the unallocated line items.
         """
         df = self.df
-        is_na = df[OtpSegmentedPnlColumns.Activity].isna()
-        oth = self._get_relevant_rows_mask()
-        mask = is_na & oth
+        is_na = df[_ACTIVITY_COL].isna().to_numpy()
+        oth = self._get_relevant_rows_mask().to_numpy()
 
-        return df[mask]  # type:ignore
+        return np.flatnonzero(is_na & oth)
 
     def _get_relevant_rows_mask(self) -> pd.Series:
-        """Get boolean mask for rows relevant to allocation based on filter_func or isin.
+        """Get the memoized boolean mask for rows relevant to allocation.
+
+        Returns:
+            A boolean Series indicating which rows should be included in allocation.
+        """
+        return self._relevant_mask
+
+    def _compute_relevant_rows_mask(self) -> pd.Series:
+        """Build the boolean mask for relevant rows based on filter_func or isin.
 
         Returns:
             A boolean Series indicating which rows should be included in allocation.
         """
         if self.filter_func is not None:
             return self.filter_func(self.df)
+        if self._cat_mask is not None:
+            return pd.Series(self._cat_mask, index=self.df.index)
         if self.isin:
-            return self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)  # type:ignore
+            return self._compute_isin_mask()
         return pd.Series([True] * len(self.df), index=self.df.index)  # type:ignore
 
+    def _compute_isin_mask(self) -> pd.Series:
+        """Build the boolean mask for rows whose Category is in self.isin.
+
+        Returns:
+            A boolean Series over the frame's index.
+        """
+        categories = self.df[_CATEGORY_COL]
+        if isinstance(categories.dtype, pd.CategoricalDtype):
+            # membership test over int8 codes instead of object hashes
+            wanted = categories.cat.categories.get_indexer(self.isin)
+            return pd.Series(
+                np.isin(categories.cat.codes.to_numpy(), wanted[wanted >= 0]),
+                index=self.df.index,
+            )
+        return categories.isin(self.isin)  # type:ignore
+
+    def _get_relevant_positions(self) -> np.ndarray:
+        """Get the cached row positions matching the Category filter.
+
+        The allocate implementations select on category membership even
+        when a filter_func drives the totals, so this is cached
+        separately from the relevant-rows mask. Positions feed the
+        allocation kernels directly, with no Index round-trip.
+
+        Returns:
+            Integer positions of rows whose Category is in self.isin.
+        """
+        if self._relevant_pos is None:
+            if self.filter_func is None and (
+                self.isin or self._cat_mask is not None
+            ):
+                mask = self._relevant_mask
+            else:
+                mask = self._compute_isin_mask()
+            self._relevant_pos = np.flatnonzero(np.asarray(mask))
+        return self._relevant_pos
+
+    def _col_values(self, column: OtpSegmentedPnlColumns) -> np.ndarray:
+        """Return the cached NumPy buffer for a column.
+
+        The cache is invalidated for a column whenever it is reassigned.
+
+        Returns:
+            The column's underlying NumPy array.
+        """
+        values = self._col_cache.get(column)
+        if values is None:
+            values = self.df[column].to_numpy()
+            self._col_cache[column] = values
+        return values
+
     def get_net_sales_total(self) -> float:
         """Compute the total net sales value for rows matching the filter (filter_func or isin).
 
@@ -96,10 +203,12 @@ class BaseHandler(SegmentationHandler):
         Returns:
             The sum of net sales as a float.
         """
-        df = self.df
-        mask = self._get_relevant_rows_mask()
-
-        return df[mask][OtpSegmentedPnlColumns.Net_Sales_Total].sum()
+        total = self._total_cache.get(_NET_SALES_COL)
+        if total is None:
+            mask = self._relevant_mask.to_numpy()
+            total = self._col_values(_NET_SALES_COL)[mask].sum()
+            self._total_cache[_NET_SALES_COL] = total
+        return total
 
     def get_cogs_total(self) -> float:
         """Compute the total COGS (Cost of Goods Sold) for rows matching the filter (filter_func or isin).
@@ -109,10 +218,12 @@ class BaseHandler(SegmentationHandler):
         Returns:
             The sum of COGS as a float.
         """
-        df = self.df
-        mask = self._get_relevant_rows_mask()
-
-        return df[mask][OtpSegmentedPnlColumns.Cogs].sum()
+        total = self._total_cache.get(_COGS_COL)
+        if total is None:
+            mask = self._relevant_mask.to_numpy()
+            total = self._col_values(_COGS_COL)[mask].sum()
+            self._total_cache[_COGS_COL] = total
+        return total
 
     def _allocate_proportionally(
         self,
@@ -120,23 +231,30 @@ class BaseHandler(SegmentationHandler):
         base_column: OtpSegmentedPnlColumns,
         base_total: float,
         target_total: float,
-        relevant_indexes: pd.Index,
+        relevant_positions: np.ndarray,
     ) -> None:
         """Allocate target_total across rows proportionally to base_column values.
 
         Args:
             base_column: Column used to compute allocation proportions.
             target_total: Total amount to distribute.
-            relevant_indexes: Row indexes to allocate across.
+            relevant_positions: Integer row positions to allocate across.
 
         Raises:
             ValueError: If the base total is zero.
         """
 
-        for i in relevant_indexes:
-            base_value = self.df.loc[i, base_column]
-            allocated = target_total * base_value / base_total
-            self.df.loc[i, self.column] += allocated
+        # scatter multiply-add over the raw buffers; the kernel is
+        # numba-compiled when available and plain NumPy otherwise
+        base_values = self.df[base_column].to_numpy(dtype=np.float64)
+        out = self.df[self.column].to_numpy(dtype=np.float64, copy=True)
+        allocate_proportional(
+            out, base_values, relevant_positions, target_total / base_total
+        )
+        self.df[self.column] = out
+        self._col_cache.pop(self.column, None)
+        self._total_cache.pop(self.column, None)
+        self._target_total = None
 
     def allocate(self) -> None:
         """Abstract method to implement allocation logic for unallocated items.
@@ -152,22 +270,29 @@ class BaseHandler(SegmentationHandler):
     def deallocate(self) -> None:
         """Reset allocated values in unallocated rows back to zero in the target column.
 
-        Iterates over indices of unallocated items and sets the value in `self.column` to 0.
+        Zeroes the value in `self.column` for all unallocated items in one write.
         Modifies `self.df` in place.
         """
-        for index in self.df_unallocated.index:
-            self.df.loc[index, self.column] = 0
+        if len(self._unalloc_pos):
+            col_pos = self.df.columns.get_loc(self.column)
+            self.df.iloc[self._unalloc_pos, col_pos] = 0.0
+            self._col_cache.pop(self.column, None)
+            self._total_cache.pop(self.column, None)
+            self._target_total = None
 
     def get_target_total(self) -> float:
         """Calculate the total value to be allocated from the target column in unallocated rows.
 
-        Sums the values in `self.column` from `self.df_unallocated`.
+        Sums the values in `self.column` over the unallocated rows.
 
         Returns:
             The total target value as a float.
         """
-        df = self.df_unallocated
-        return df[self.column].sum()
+        if self._target_total is None:
+            self._target_total = self._col_values(self.column)[
+                self._unalloc_pos
+            ].sum()
+        return self._target_total
 
     def process(self) -> pd.DataFrame:
         """Execute the full allocation and deallocation process.
@@ -200,7 +325,7 @@ class BaseHandler(SegmentationHandler):
         Returns:
             A list of appropriate Category enums for filtering (e.g., for total calculations).
         """
-        uniq = df[OtpSegmentedPnlColumns.Activity].unique().tolist()
+        uniq = df[_ACTIVITY_COL].unique().tolist()
         uniq = [x for x in uniq if not pd.isna(x)]  # filter out pd.NAs for comparison
         isin = [Category.Distribution, Category.ContractManufacturing]
 
@@ -25,70 +25,77 @@ class CogsHandler(BaseHandler):
             OtpSegmentedPnlColumns.Cogs,
             column,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
             )
 
     def allocate_to_line_items_by_cogs(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="cogs",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="cogs",
+            )
+        relevant_positions = self._get_relevant_positions()
 
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_cogs_total()
         target_total = self.get_target_total()
 
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_totals_computed",
+                handler=type(self).__name__,
+                base_total=base_total,
+                target_total=target_total,
+            )
 
         if base_total == 0:
             if target_total == 0:
+                if self._debug_enabled:
+                    self.logger.debug(
+                        "allocation_skipped",
+                        handler=type(self).__name__,
+                        reason="base_and_target_zero",
+                    )
+                return
+            if self._debug_enabled:
                 self.logger.debug(
                     "allocation_skipped",
                     handler=type(self).__name__,
-                    reason="base_and_target_zero",
+                    reason="base_zero_target_nonzero",
                 )
-                return
-            self.logger.debug(
-                "allocation_skipped",
-                handler=type(self).__name__,
-                reason="base_zero_target_nonzero",
-            )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Cogs,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="cogs",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="cogs",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_cogs()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply COGS allocation to the DataFrame.
@@ -9,10 +9,16 @@ which rows should be included.
 
 from typing import Callable, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.enums import Category, OtpSegmentedPnlColumns
 
+# plain-string column handles, resolved once at import (same pattern as
+# the base handler)
+_CATEGORY_COL = OtpSegmentedPnlColumns.Category.value
+_ORG_BU_COL = OtpSegmentedPnlColumns.OrgBU.value
+
 
 def create_business_unit_category_filter(
     business_units: List[str],
@@ -49,17 +55,38 @@ def create_business_unit_category_filter(
         ... )
     """
 
-    def filter_func(df: pd.DataFrame) -> pd.Series:
-        # Check which rows belong to the specified business units
-        is_special_bu = df[OtpSegmentedPnlColumns.OrgBU].isin(business_units)
+    # materialized once when the filter is created rather than on every call
+    business_units_arr = np.asarray(business_units, dtype=object)
+    default_categories_set = (
+        frozenset(default_categories) if default_categories else None
+    )
 
-        if category is not None:
-            is_category = df[OtpSegmentedPnlColumns.Category] == category
-            return is_special_bu & is_category  # type:ignore
+    def filter_func(df: pd.DataFrame) -> pd.Series:
+        if default_categories_set and category is None:
+            # the Category column is categorical by the time handlers run,
+            # so isin resolves over integer codes
+            return df[_CATEGORY_COL].isin(default_categories_set)  # type:ignore
 
-        if default_categories:
-            return df[OtpSegmentedPnlColumns.Category].isin(default_categories)  # type:ignore
+        # the masks are built on the raw arrays and wrapped in a Series
+        # without a copy, sparing the per-operator alignment checks
+        is_special_bu = np.isin(df[_ORG_BU_COL].to_numpy(), business_units_arr)
 
-        return is_special_bu  # type:ignore
+        if category is not None:
+            cat_col = df[_CATEGORY_COL]
+            if isinstance(cat_col.dtype, pd.CategoricalDtype):
+                # compare int8 codes instead of Enum __eq__ per cell
+                # (same pattern as BaseHandler._compute_isin_mask)
+                code = cat_col.cat.categories.get_indexer([category])[0]
+                if code < 0:
+                    is_category = np.zeros(len(df), dtype=bool)
+                else:
+                    is_category = cat_col.cat.codes.to_numpy() == code
+            else:
+                is_category = cat_col.to_numpy() == category
+            return pd.Series(
+                np.logical_and(is_special_bu, is_category), index=df.index, copy=False
+            )
+
+        return pd.Series(is_special_bu, index=df.index, copy=False)
 
     return filter_func
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -14,6 +15,11 @@ from .base import BaseHandler
 
 ISIN = [Category.OwnManufacturingIC, Category.OwnManufacturingThirdParty]
 
+# plain-string column handles for the per-call accesses, resolved once
+# at import (same pattern as the base handler)
+_ACTIVITY_COL = OtpSegmentedPnlColumns.Activity.value
+_ORG_BU_COL = OtpSegmentedPnlColumns.OrgBU.value
+
 
 class GsDivbuHandler(BaseHandler):
     """Handler for integrating GS divbu model and charges into the segmentation process.
@@ -41,6 +47,7 @@ class GsDivbuHandler(BaseHandler):
         ] = OtpSegmentedPnlColumns.OH_Administration,
         isin: Optional[List[Category]] = ISIN,
         relevant_bus: List[str] = ["GS"],
+        cat_mask: Optional[np.ndarray] = None,
     ) -> None:
         self.logger = structlog.get_logger(__name__)
         self.logger.info(
@@ -55,7 +62,8 @@ class GsDivbuHandler(BaseHandler):
             column,
             OtpSegmentedPnlColumns.OrgBU,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
@@ -63,61 +71,84 @@ class GsDivbuHandler(BaseHandler):
 
         self.data_gs_model = gs_model.generate_pipeline_context()
         self.data_gs_charges = gs_charges.generate_pipeline_context()
-        self.relevant_bu = [x.upper() for x in relevant_bus]
+        # normalized once to a frozenset so the isin membership checks
+        # below hash against a prebuilt set
+        self.relevant_bu = frozenset(x.upper() for x in relevant_bus)
+        # OrgBU is never rewritten by the handler, so the membership mask
+        # is scanned once and shared by the unallocated/target lookups
+        self._bu_mask = df[_ORG_BU_COL].isin(self.relevant_bu).to_numpy()
         self.company_code = company_code
-        super().__init__(df, column, isin)
+        # the model charge is fixed per company code, so the two-level
+        # dict lookup runs once instead of per get_target_total call
+        self._this_year_charge = self.data_gs_model.get(self.company_code, {}).get(
+            HighLevelSegmentedPnlColumns.TotalSAR, 0
+        )
+        super().__init__(df, column, isin, cat_mask=cat_mask)
 
     def allocate_to_line_items_by_net_sales(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
+        relevant_positions = self._get_relevant_positions()
+        if not len(relevant_positions):
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="no_relevant_rows",
+                )
+            return
 
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_net_sales_total()
         target_total = self.get_target_total()
 
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
-
-        if base_total == 0:
+        if self._debug_enabled:
             self.logger.debug(
-                "allocation_skipped",
+                "allocation_totals_computed",
                 handler=type(self).__name__,
-                reason="base_zero",
+                base_total=base_total,
+                target_total=target_total,
             )
+
+        if base_total == 0:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="base_zero",
+                )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Net_Sales_Total,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_net_sales()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply GS divbu integration and allocation to the DataFrame.
@@ -155,53 +186,60 @@ class GsDivbuHandler(BaseHandler):
                 company_code=self.company_code,
             )
 
-    def _get_unallocated_line_items(self) -> pd.DataFrame:
-        self.logger.debug(
-            "unallocated_line_items_requested",
-            handler=type(self).__name__,
-            relevant_bu=self.relevant_bu,
-        )
+    def _get_unallocated_positions(self) -> np.ndarray:
+        if self._debug_enabled:
+            self.logger.debug(
+                "unallocated_line_items_requested",
+                handler=type(self).__name__,
+                relevant_bu=self.relevant_bu,
+            )
         df = self.df
 
-        unallocated = df[
-            (df[OtpSegmentedPnlColumns.Activity].isna())
-            & (df[OtpSegmentedPnlColumns.OrgBU].isin(self.relevant_bu))
-        ]  # type:ignore
-        self.logger.debug(
-            "unallocated_line_items_found",
-            handler=type(self).__name__,
-            count=len(unallocated),
+        unallocated = np.flatnonzero(
+            df[_ACTIVITY_COL].isna().to_numpy() & self._bu_mask
         )
-        return unallocated  # type:ignore
+        if self._debug_enabled:
+            self.logger.debug(
+                "unallocated_line_items_found",
+                handler=type(self).__name__,
+                count=len(unallocated),
+            )
+        return unallocated
 
     def get_target_total(self) -> float:
-        self.logger.debug(
-            "target_total_calculation_started",
-            handler=type(self).__name__,
-            company_code=self.company_code,
-        )
-        column_total = self.df[
-            self.df[OtpSegmentedPnlColumns.OrgBU].isin(self.relevant_bu)
-        ][self.column].sum()
-        self.logger.debug(
-            "target_total_column_total_computed",
-            handler=type(self).__name__,
-            column_total=column_total,
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_total_calculation_started",
+                handler=type(self).__name__,
+                company_code=self.company_code,
+            )
+        # skip the reduction when no row belongs to the relevant BUs,
+        # which is the common case for company codes without GS lines
+        column_total = (
+            self.df.loc[self._bu_mask, self.column].sum()
+            if self._bu_mask.any()
+            else 0.0
         )
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_total_column_total_computed",
+                handler=type(self).__name__,
+                column_total=column_total,
+            )
 
-        this_year_charge = self.data_gs_model.get(self.company_code, {}).get(
-            HighLevelSegmentedPnlColumns.TotalSAR, 0
-        )
-        self.logger.debug(
-            "target_total_charge_loaded",
-            handler=type(self).__name__,
-            this_year_charge=this_year_charge,
-        )
+        this_year_charge = self._this_year_charge
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_total_charge_loaded",
+                handler=type(self).__name__,
+                this_year_charge=this_year_charge,
+            )
 
         target_total = column_total - this_year_charge
-        self.logger.debug(
-            "target_total_calculated",
-            handler=type(self).__name__,
-            target_total=target_total,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_total_calculated",
+                handler=type(self).__name__,
+                target_total=target_total,
+            )
         return target_total
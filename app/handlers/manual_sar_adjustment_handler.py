@@ -1,12 +1,25 @@
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import structlog
 
 from app.enums import Category, OtpSegmentedPnlColumns
 
+from ._kernels import adjust_sar
 from .base import BaseHandler
 
+# plain-string column handles for the per-adjustment accesses, resolved
+# once at import (same pattern as the base handler)
+_NET_SALES_COL = OtpSegmentedPnlColumns.Net_Sales_Total.value
+_EBIT_COL = OtpSegmentedPnlColumns.Ebit.value
+_TOTAL_SAR_COL = OtpSegmentedPnlColumns.Total_SAR.value
+_SAR_COLS = [
+    OtpSegmentedPnlColumns.Sales_and_Marketing_OH.value,
+    OtpSegmentedPnlColumns.OH_Administration.value,
+    OtpSegmentedPnlColumns.Research_and_Technology_OH.value,
+]
+
 
 class ManualEbitErosionAdjustmentHandler(BaseHandler):
     """Adjusts EBIT erosion via SAR allocations in specified categories."""
@@ -46,7 +59,8 @@ class ManualEbitErosionAdjustmentHandler(BaseHandler):
             OtpSegmentedPnlColumns.Total_SAR,
             column,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             self.logger.error(
                 "missing_required_columns",
@@ -66,25 +80,28 @@ class ManualEbitErosionAdjustmentHandler(BaseHandler):
         Returns:
             float - The EBIT margin (EBIT sum / Net Sales sum).
         """
-        self.logger.debug(
-            "ebit_margin_calculation_started",
-            handler=type(self).__name__,
-            df_shape=df.shape,
-        )
-        net_sales = df[OtpSegmentedPnlColumns.Net_Sales_Total].sum()
-        ebit = df[OtpSegmentedPnlColumns.Ebit].sum()
-        self.logger.debug(
-            "ebit_margin_inputs",
-            handler=type(self).__name__,
-            net_sales=net_sales,
-            ebit=ebit,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "ebit_margin_calculation_started",
+                handler=type(self).__name__,
+                df_shape=df.shape,
+            )
+        net_sales = df[_NET_SALES_COL].sum()
+        ebit = df[_EBIT_COL].sum()
+        if self._debug_enabled:
+            self.logger.debug(
+                "ebit_margin_inputs",
+                handler=type(self).__name__,
+                net_sales=net_sales,
+                ebit=ebit,
+            )
         margin = ebit / net_sales
-        self.logger.debug(
-            "ebit_margin_calculated",
-            handler=type(self).__name__,
-            margin=margin,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "ebit_margin_calculated",
+                handler=type(self).__name__,
+                margin=margin,
+            )
         return margin
 
     def adjust_sar_ratio(self) -> None:
@@ -96,80 +113,93 @@ class ManualEbitErosionAdjustmentHandler(BaseHandler):
         No return value; modifies self.df in place.
         """
         self.logger.info("sar_adjustment_started", handler=type(self).__name__)
+        relevant_positions = self._get_relevant_positions()
+        if not len(relevant_positions):
+            if self._debug_enabled:
+                self.logger.debug(
+                    "sar_adjustment_skipped",
+                    handler=type(self).__name__,
+                    reason="no_relevant_rows",
+                )
+            return
         current_ebit_margin = self.get_ebit_margin(self.df_otp)
-        self.logger.debug(
-            "current_ebit_margin_loaded",
-            handler=type(self).__name__,
-            current_ebit_margin=current_ebit_margin,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "current_ebit_margin_loaded",
+                handler=type(self).__name__,
+                current_ebit_margin=current_ebit_margin,
+            )
         target_ebit_margin = current_ebit_margin + self.target_ebit_erosion
-        self.logger.debug(
-            "target_ebit_margin_computed",
-            handler=type(self).__name__,
-            target_ebit_margin=target_ebit_margin,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_ebit_margin_computed",
+                handler=type(self).__name__,
+                target_ebit_margin=target_ebit_margin,
+            )
         target_ebit = self.get_net_sales_total() * target_ebit_margin
-        self.logger.debug(
-            "target_ebit_computed",
-            handler=type(self).__name__,
-            target_ebit=target_ebit,
-        )
-        current_ebit = self.df[OtpSegmentedPnlColumns.Ebit].sum()
-        self.logger.debug(
-            "current_ebit_loaded",
-            handler=type(self).__name__,
-            current_ebit=current_ebit,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "target_ebit_computed",
+                handler=type(self).__name__,
+                target_ebit=target_ebit,
+            )
+        current_ebit = self.df[_EBIT_COL].sum()
+        if self._debug_enabled:
+            self.logger.debug(
+                "current_ebit_loaded",
+                handler=type(self).__name__,
+                current_ebit=current_ebit,
+            )
         ebit_diff = target_ebit - current_ebit
-        self.logger.debug(
-            "ebit_diff_computed",
-            handler=type(self).__name__,
-            ebit_diff=ebit_diff,
-        )
-        current_total_sar = self.df[OtpSegmentedPnlColumns.Total_SAR].sum()
-        self.logger.debug(
-            "current_total_sar_loaded",
-            handler=type(self).__name__,
-            current_total_sar=current_total_sar,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "ebit_diff_computed",
+                handler=type(self).__name__,
+                ebit_diff=ebit_diff,
+            )
+        current_total_sar = self.df[_TOTAL_SAR_COL].sum()
+        if self._debug_enabled:
+            self.logger.debug(
+                "current_total_sar_loaded",
+                handler=type(self).__name__,
+                current_total_sar=current_total_sar,
+            )
 
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         self.logger.info(
             "sar_adjustments_started",
             handler=type(self).__name__,
-            rows=len(relevant_indexes),
+            rows=len(relevant_positions),
         )
-        for idx in relevant_indexes:
-            temp_total_sar = self.df.loc[idx, OtpSegmentedPnlColumns.Total_SAR]
-            columns = [
-                OtpSegmentedPnlColumns.Sales_and_Marketing_OH,
-                OtpSegmentedPnlColumns.OH_Administration,
-                OtpSegmentedPnlColumns.Research_and_Technology_OH,
-            ]
-            for col in columns:
-                self.df.loc[idx, col] = (
-                    (temp_total_sar / current_total_sar)
-                    * (self.df.loc[idx, col] / temp_total_sar)
-                    * ebit_diff
-                )
-
-            self.df.loc[idx, OtpSegmentedPnlColumns.Total_SAR] = self.df.loc[
-                idx, columns
-            ].sum()
-            self.logger.debug(
-                "sar_row_adjusted",
-                handler=type(self).__name__,
-                index=idx,
-                total_sar=self.df.loc[idx, OtpSegmentedPnlColumns.Total_SAR],
-            )
+        # the per-row algebra (sar/total_sar) * (col/sar) * diff reduces
+        # to col * diff / total_sar; the scatter scale-and-resum runs in
+        # the kernel, numba-compiled when available and NumPy otherwise
+        sm_oh = self.df[_SAR_COLS[0]].to_numpy(dtype=np.float64, copy=True)
+        oh_adm = self.df[_SAR_COLS[1]].to_numpy(dtype=np.float64, copy=True)
+        rt_oh = self.df[_SAR_COLS[2]].to_numpy(dtype=np.float64, copy=True)
+        total_sar = self.df[_TOTAL_SAR_COL].to_numpy(dtype=np.float64, copy=True)
+        adjust_sar(
+            sm_oh,
+            oh_adm,
+            rt_oh,
+            total_sar,
+            relevant_positions,
+            ebit_diff / current_total_sar,
+        )
+        self.df[_SAR_COLS[0]] = sm_oh
+        self.df[_SAR_COLS[1]] = oh_adm
+        self.df[_SAR_COLS[2]] = rt_oh
+        self.df[_TOTAL_SAR_COL] = total_sar
+        for col in (*_SAR_COLS, _TOTAL_SAR_COL):
+            self._col_cache.pop(col, None)
+            self._total_cache.pop(col, None)
+        self._target_total = None
         self.logger.info("sar_adjustment_completed", handler=type(self).__name__)
 
     def allocate(self) -> None:
@@ -179,9 +209,11 @@ class ManualEbitErosionAdjustmentHandler(BaseHandler):
 
         No return value; modifies self.df in place.
         """
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.adjust_sar_ratio()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Adjust SAR allocations for target EBIT erosion in ManualEbitErosionAdjustmentHandler.
@@ -26,63 +26,69 @@ class OtherExpenseHandler(BaseHandler):
             OtpSegmentedPnlColumns.Net_Sales_Total,
             column,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
             )
 
     def allocate_to_line_items_by_net_sales(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
+        relevant_positions = self._get_relevant_positions()
 
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_net_sales_total()
         target_total = self.get_target_total()
 
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
-
-        if base_total == 0:
+        if self._debug_enabled:
             self.logger.debug(
-                "allocation_skipped",
+                "allocation_totals_computed",
                 handler=type(self).__name__,
-                reason="base_zero",
+                base_total=base_total,
+                target_total=target_total,
             )
+
+        if base_total == 0:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="base_zero",
+                )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Net_Sales_Total,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_net_sales()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply other expenses allocation to the DataFrame.
@@ -3,10 +3,47 @@ from typing import List, Optional
 import pandas as pd
 import structlog
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 from app.enums import Category, OtpSegmentedPnlColumns
 
 from .base import BaseHandler
 
+# plain-string column handles for the per-allocate accesses, resolved
+# once at import (same pattern as the base handler)
+_SM_COL = OtpSegmentedPnlColumns.Sales_and_Marketing_OH.value
+_ADMIN_COL = OtpSegmentedPnlColumns.OH_Administration.value
+_RT_COL = OtpSegmentedPnlColumns.Research_and_Technology_OH.value
+_TOTAL_SAR_COL = OtpSegmentedPnlColumns.Total_SAR.value
+_EBIT_COL = OtpSegmentedPnlColumns.Ebit.value
+
+# the columns whose movement against the reference feeds the EBIT update
+_DIFF_COLS = [
+    OtpSegmentedPnlColumns.Cogs.value,
+    OtpSegmentedPnlColumns.Variances.value,
+    _TOTAL_SAR_COL,
+    OtpSegmentedPnlColumns.Other_Expenses.value,
+    OtpSegmentedPnlColumns.Other_Income.value,
+    OtpSegmentedPnlColumns.Unusual_Expenses_Income.value,
+]
+# fused delta expression over per-column views, evaluated by numexpr in
+# one pass when available
+_DELTA_EXPR = " + ".join(f"(c{i} - r{i})" for i in range(len(_DIFF_COLS)))
+
+
+def _ebit_delta(current, reference):
+    """Row-wise sum of (current - reference) over the diff columns."""
+    if numexpr is not None:
+        local_dict = {f"c{i}": current[:, i] for i in range(len(_DIFF_COLS))}
+        local_dict.update(
+            (f"r{i}", reference[:, i]) for i in range(len(_DIFF_COLS))
+        )
+        return numexpr.evaluate(_DELTA_EXPR, local_dict=local_dict)
+    return (current - reference).sum(axis=1)
+
 
 class RecalculateTotals(BaseHandler):
     """Handler for recalculating P&L totals after segmentation.
@@ -52,57 +89,55 @@ class RecalculateTotals(BaseHandler):
             OtpSegmentedPnlColumns.Ebit,
             OtpSegmentedPnlColumns.CompanyCode,
         ]
-        missing_cols = [col for col in required_cols if col not in self.df.columns]
+        cols_set = frozenset(self.df.columns)
+        missing_cols = [col for col in required_cols if col not in cols_set]
         if missing_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_cols}"
             )
 
+        ref_cols_set = frozenset(self.df_reference.columns)
         missing_ref_cols = [
-            col for col in required_cols[:-1] if col not in self.df_reference.columns
+            col for col in required_cols[:-1] if col not in ref_cols_set
         ]
         if missing_ref_cols:
             raise KeyError(
                 f"Missing required columns in df_reference for {self.__class__.__name__}: {missing_ref_cols}"
             )
 
+        # align the reference to the working frame once; allocate then
+        # runs on plain NumPy blocks with no per-call index realignment
+        self._reference_block = self.df_reference.reindex(self.df.index)[
+            _DIFF_COLS
+        ].to_numpy()
+
     def allocate(self) -> None:
         self.logger.info(
             "recalculate_totals_started",
             handler=type(self).__name__,
             company_code=self.company_code,
         )
-        diff = None
-        df = self.df.copy()
+        # the handlers mutate their frame in place; the full-frame copy
+        # here doubled the handler's memory traffic for no isolation
+        df = self.df
 
-        df[OtpSegmentedPnlColumns.Total_SAR] = (
-            df[OtpSegmentedPnlColumns.Sales_and_Marketing_OH]
-            + df[OtpSegmentedPnlColumns.OH_Administration]
-            + df[OtpSegmentedPnlColumns.Research_and_Technology_OH]
-        )
+        df[_TOTAL_SAR_COL] = df[_SM_COL] + df[_ADMIN_COL] + df[_RT_COL]
 
-        self.logger.debug("total_sar_recalculated", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("total_sar_recalculated", handler=type(self).__name__)
 
-        for col in [
-            OtpSegmentedPnlColumns.Cogs,
-            OtpSegmentedPnlColumns.Variances,
-            OtpSegmentedPnlColumns.Total_SAR,
-            OtpSegmentedPnlColumns.Other_Expenses,
-            OtpSegmentedPnlColumns.Other_Income,
-            OtpSegmentedPnlColumns.Unusual_Expenses_Income,
-        ]:
-            old_total = self.df_reference[col]
-            new_total = df[col]
-            diff = new_total - old_total
+        # one block subtraction and one EBIT update instead of a Series
+        # subtraction and __iadd__ per column; the reference block was
+        # aligned in __init__
+        current = df[_DIFF_COLS].to_numpy()
+        delta = _ebit_delta(current, self._reference_block)
+        if self._debug_enabled:
             self.logger.debug(
                 "recalculation_diff_computed",
                 handler=type(self).__name__,
-                column=col,
-                diff_sum=diff.sum(),
+                diff_sum=delta.sum(),
             )
-            df[OtpSegmentedPnlColumns.Ebit] += diff
-
-        self.df = df
+        df[_EBIT_COL] = df[_EBIT_COL].to_numpy() + delta
 
         self.logger.info(
             "recalculate_totals_completed",
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Callable, List, Optional
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -40,8 +41,10 @@ class RndHandler(BaseHandler):
         isin: Optional[List[Category]] = ISIN,
         df_rnd_services: Optional[pd.DataFrame] = None,
         filter_func: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+        rnd_sar_cost_by_company: Optional[dict] = None,
+        cat_mask: Optional[np.ndarray] = None,
     ) -> None:
-        super().__init__(df, column, isin, filter_func)
+        super().__init__(df, column, isin, filter_func, cat_mask=cat_mask)
 
         self.logger = structlog.get_logger(__name__)
         self.logger.info(
@@ -55,7 +58,8 @@ class RndHandler(BaseHandler):
             OtpSegmentedPnlColumns.Net_Sales_Total,
             column,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
@@ -63,20 +67,43 @@ class RndHandler(BaseHandler):
 
         self.company_code = company_code
         self.df_rnd_services = df_rnd_services
+        self.rnd_sar_cost_by_company = rnd_sar_cost_by_company
+        # the services frame and company code are fixed per handler, so
+        # the scalar is resolved at most once per instance
+        self._sar_cost_cache: Optional[float] = None
 
     def get_rnd_services_costs(self) -> float:
-        self.logger.debug(
-            "rnd_services_costs_requested",
-            handler=type(self).__name__,
-            company_code=self.company_code,
-        )
-        if self.df_rnd_services is None:
+        if self._sar_cost_cache is None:
+            self._sar_cost_cache = self._compute_rnd_services_costs()
+        return self._sar_cost_cache
+
+    def _compute_rnd_services_costs(self) -> float:
+        if self._debug_enabled:
             self.logger.debug(
-                "rnd_services_costs_skipped",
+                "rnd_services_costs_requested",
                 handler=type(self).__name__,
                 company_code=self.company_code,
-                reason="missing_df_rnd_services",
             )
+        if self.rnd_sar_cost_by_company is not None:
+            # per-company scalar derived once upstream; falls back to
+            # scanning the services frame when the lookup is not supplied
+            sar_cost = self.rnd_sar_cost_by_company.get(self.company_code, 0.0)
+            if self._debug_enabled:
+                self.logger.debug(
+                    "rnd_services_costs_calculated",
+                    handler=type(self).__name__,
+                    company_code=self.company_code,
+                    sar_cost=sar_cost,
+                )
+            return sar_cost
+        if self.df_rnd_services is None:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "rnd_services_costs_skipped",
+                    handler=type(self).__name__,
+                    company_code=self.company_code,
+                    reason="missing_df_rnd_services",
+                )
             return 0.0
 
         df = self.df_rnd_services
@@ -86,77 +113,86 @@ class RndHandler(BaseHandler):
         ][SapBwColumns.Amount]
 
         if sar_cost.empty:  # type:ignore
-            self.logger.debug(
-                "rnd_services_costs_skipped",
-                handler=type(self).__name__,
-                company_code=self.company_code,
-                reason="empty_sar_cost",
-            )
+            if self._debug_enabled:
+                self.logger.debug(
+                    "rnd_services_costs_skipped",
+                    handler=type(self).__name__,
+                    company_code=self.company_code,
+                    reason="empty_sar_cost",
+                )
             return 0.0
 
-        sar_cost = sar_cost.iloc[0]  # type:ignore
+        # raw buffer read instead of the iloc indexer machinery for
+        # a single scalar
+        sar_cost = sar_cost.to_numpy()[0]  # type:ignore
 
         if TYPE_CHECKING:
             assert isinstance(sar_cost, float)
 
-        self.logger.debug(
-            "rnd_services_costs_calculated",
-            handler=type(self).__name__,
-            company_code=self.company_code,
-            sar_cost=sar_cost,
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "rnd_services_costs_calculated",
+                handler=type(self).__name__,
+                company_code=self.company_code,
+                sar_cost=sar_cost,
+            )
 
         return sar_cost
 
     def allocate_to_line_items_by_net_sales(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
+        relevant_positions = self._get_relevant_positions()
 
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_net_sales_total()
         target_total = self.get_target_total()
         target_total -= self.get_rnd_services_costs()
 
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
-
-        if base_total == 0:
+        if self._debug_enabled:
             self.logger.debug(
-                "allocation_skipped",
+                "allocation_totals_computed",
                 handler=type(self).__name__,
-                reason="base_zero",
+                base_total=base_total,
+                target_total=target_total,
             )
+
+        if base_total == 0:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="base_zero",
+                )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Net_Sales_Total,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_net_sales()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
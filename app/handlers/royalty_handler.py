@@ -26,6 +26,7 @@ class RoyaltyHandler(BaseHandler):
             OtpSegmentedPnlColumns
         ] = OtpSegmentedPnlColumns.OH_Administration,
         isin: Optional[List[Category]] = ISIN,
+        royalty_expense_by_company: Optional[dict] = None,
     ) -> None:
         self.logger = structlog.get_logger(__name__)
         self.logger.info(
@@ -39,7 +40,8 @@ class RoyaltyHandler(BaseHandler):
             OtpSegmentedPnlColumns.Net_Sales_Total,
             column,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
@@ -59,81 +61,104 @@ class RoyaltyHandler(BaseHandler):
 
         self.company_code = company_code
         self.df_royalty = df_royalty
+        self.royalty_expense_by_company = royalty_expense_by_company
+        # the royalty frame and company code are fixed per handler, so
+        # the scalar is resolved at most once per instance
+        self._royalty_expense_cache: Optional[float] = None
         super().__init__(df, column, isin)
 
     def _get_royalty_expense(self) -> float:
-        self.logger.debug(
-            "royalty_expense_calculation_started",
-            handler=type(self).__name__,
-            company_code=self.company_code,
-        )
-        df = self.df_royalty
-        df = df[
-            (df[SapBwColumns.CompanyCode] == self.company_code)
-            & (df[SapBwColumns.Amount] < 0)
-        ]
+        if self._royalty_expense_cache is None:
+            self._royalty_expense_cache = self._compute_royalty_expense()
+        return self._royalty_expense_cache
 
-        if df.empty:
-            result = 0.0
+    def _compute_royalty_expense(self) -> float:
+        if self._debug_enabled:
+            self.logger.debug(
+                "royalty_expense_calculation_started",
+                handler=type(self).__name__,
+                company_code=self.company_code,
+            )
+        if self.royalty_expense_by_company is not None:
+            # per-company scalar derived once upstream; falls back to
+            # scanning the royalty frame when the lookup is not supplied
+            result = self.royalty_expense_by_company.get(self.company_code, 0.0)
         else:
-            result = df[SapBwColumns.Amount].iloc[0]  # type:ignore
-
-        self.logger.debug(
-            "royalty_expense_calculated",
-            handler=type(self).__name__,
-            royalty_expense=result,
-        )
+            df = self.df_royalty
+            df = df[
+                (df[SapBwColumns.CompanyCode] == self.company_code)
+                & (df[SapBwColumns.Amount] < 0)
+            ]
+
+            if df.empty:
+                result = 0.0
+            else:
+                # raw buffer read instead of the iloc indexer
+                # machinery for a single scalar
+                result = df[SapBwColumns.Amount].to_numpy()[0]  # type:ignore
+
+        if self._debug_enabled:
+            self.logger.debug(
+                "royalty_expense_calculated",
+                handler=type(self).__name__,
+                royalty_expense=result,
+            )
         return result
 
     def allocate_to_line_items_by_net_sales(self) -> None:
-        self.logger.debug(
-            "allocation_started",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
-        relevant_indexes = self.df[
-            self.df[OtpSegmentedPnlColumns.Category].isin(self.isin)
-        ].index
-        self.logger.debug(
-            "relevant_indexes_found",
-            handler=type(self).__name__,
-            count=len(relevant_indexes),
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_started",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
+        relevant_positions = self._get_relevant_positions()
+        if self._debug_enabled:
+            self.logger.debug(
+                "relevant_positions_found",
+                handler=type(self).__name__,
+                count=len(relevant_positions),
+            )
 
         base_total = self.get_net_sales_total()
         target_total = self._get_royalty_expense()
-        self.logger.debug(
-            "allocation_totals_computed",
-            handler=type(self).__name__,
-            base_total=base_total,
-            target_total=target_total,
-        )
-
-        if base_total == 0:
+        if self._debug_enabled:
             self.logger.debug(
-                "allocation_skipped",
+                "allocation_totals_computed",
                 handler=type(self).__name__,
-                reason="base_zero",
+                base_total=base_total,
+                target_total=target_total,
             )
+
+        if base_total == 0:
+            if self._debug_enabled:
+                self.logger.debug(
+                    "allocation_skipped",
+                    handler=type(self).__name__,
+                    reason="base_zero",
+                )
             return
 
         self._allocate_proportionally(
             base_column=OtpSegmentedPnlColumns.Net_Sales_Total,
             base_total=base_total,
             target_total=target_total,
-            relevant_indexes=relevant_indexes,
+            relevant_positions=relevant_positions,
         )
 
-        self.logger.debug(
-            "allocation_completed",
-            handler=type(self).__name__,
-            base="net_sales",
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                "allocation_completed",
+                handler=type(self).__name__,
+                base="net_sales",
+            )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
         self.allocate_to_line_items_by_net_sales()
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply administrative overhead allocation to the DataFrame.
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -7,6 +8,11 @@ from app.enums import Category, OtpSegmentedPnlColumns
 
 from .base import BaseHandler
 
+# plain-string column handles for the per-allocate accesses, resolved
+# once at import (same pattern as the base handler)
+_GP_COL = OtpSegmentedPnlColumns.Gross_Profit_After_Variances.value
+_VA_INV_COL = OtpSegmentedPnlColumns.VA_Inventory_Receivables_non_c.value
+
 
 class VaInventoryReceivablesHandler(BaseHandler):
     """Handler for recalculating P&L totals after segmentation.
@@ -35,22 +41,33 @@ class VaInventoryReceivablesHandler(BaseHandler):
             OtpSegmentedPnlColumns.Gross_Profit_After_Variances,
             OtpSegmentedPnlColumns.VA_Inventory_Receivables_non_c,
         ]
-        missing_df_cols = [col for col in required_df_cols if col not in df.columns]
+        cols_set = frozenset(df.columns)
+        missing_df_cols = [col for col in required_df_cols if col not in cols_set]
         if missing_df_cols:
             raise KeyError(
                 f"Missing required columns in DataFrame for {self.__class__.__name__}: {missing_df_cols}"
             )
 
     def allocate(self) -> None:
-        self.logger.debug("allocation_phase_started", handler=type(self).__name__)
-        self.df[OtpSegmentedPnlColumns.Gross_Profit_After_Variances] += self.df[
-            OtpSegmentedPnlColumns.VA_Inventory_Receivables_non_c
-        ]
-        self.logger.debug(
-            "va_inventory_adjustment_applied",
-            handler=type(self).__name__,
-        )
-        self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_started", handler=type(self).__name__)
+        # one vector add over raw buffers instead of a Series __iadd__
+        # with its alignment and intermediate allocation; copy-on-write
+        # hands out read-only views, so the add runs into a copied buffer
+        # that is written back as the column
+        gp = self.df[_GP_COL].to_numpy(dtype=np.float64, copy=True)
+        va = self.df[_VA_INV_COL].to_numpy(dtype=np.float64)
+        np.add(gp, va, out=gp)
+        self.df[_GP_COL] = gp
+        self._col_cache.pop(_GP_COL, None)
+        self._total_cache.pop(_GP_COL, None)
+        if self._debug_enabled:
+            self.logger.debug(
+                "va_inventory_adjustment_applied",
+                handler=type(self).__name__,
+            )
+        if self._debug_enabled:
+            self.logger.debug("allocation_phase_completed", handler=type(self).__name__)
 
     def process(self) -> pd.DataFrame:
         """Apply VA inventory and receivables adjustments to the DataFrame.
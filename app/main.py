@@ -1,6 +1,10 @@
 # ruff: noqa E402
+import logging
+import sys
 import warnings
-from typing import TYPE_CHECKING, List
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
 import structlog
@@ -20,7 +24,11 @@ from app.config import (
     pipeline_config,
     segment_config,
 )
-from app.enums import OtpSegmentedPnlColumns
+from app.enums import (
+    HighLevelSegmentedPnlColumns,
+    OtpSegmentedPnlColumns,
+    SapBwColumns,
+)
 from app.etl.loaders.grand_totals import GrandTotalETL
 from app.etl.loaders.gs_divbu_charges import GsDivBuChargesETL
 from app.etl.loaders.gs_divbu_model import GsDivbuModelETL
@@ -30,6 +38,13 @@ from app.etl.loaders.royalties import RoyaltiesETL
 from app.pipelines import PipelineFactory
 from app.pipelines.context import PipelineContext
 
+# company_config is static for the process, so the per-code lookup is
+# built once at import; the proxy keeps callers (and workers) from
+# mutating it
+_COMPANY_CONFIG_LOOKUP = MappingProxyType(
+    {conf.company_code.upper(): conf for conf in company_config}
+)
+
 
 def _build_pipeline_context(
     logger,
@@ -66,6 +81,11 @@ def _build_pipeline_context(
     )
     logger.info("otp_segmented_pnl_etl_instantiated")
     df_otp = etl_otp_pnl.transform()
+    # CompanyCode drives per-company filters downstream; categorical
+    # codes turn those scans into integer comparisons
+    df_otp[OtpSegmentedPnlColumns.CompanyCode] = df_otp[
+        OtpSegmentedPnlColumns.CompanyCode
+    ].astype("category")
     logger.info("otp_transformed", rows=len(df_otp))
 
     etl_gsdivbu_model = GsDivbuModelETL(app_config.data_sources.shared_services)
@@ -78,21 +98,146 @@ def _build_pipeline_context(
     df_rnd_services = etl_rnd_services.transform()
     logger.info("rnd_services_transformed", rows=len(df_rnd_services))
 
+    # derive the per-company scalars once so the handlers resolve them
+    # with a dict lookup instead of rescanning the frames per company;
+    # first() keeps the first-matching-row semantics of the handlers'
+    # own filters
+    negative_royalties = df_royalties[df_royalties[SapBwColumns.Amount] < 0]
+    royalty_expense_by_company = (
+        negative_royalties.groupby(SapBwColumns.CompanyCode, sort=False)[
+            SapBwColumns.Amount
+        ]
+        .first()
+        .to_dict()
+    )
+    rnd_sar_rows = df_rnd_services[
+        df_rnd_services[SapBwColumns.PnlItem]
+        == HighLevelSegmentedPnlColumns.TotalSAR
+    ]
+    rnd_sar_cost_by_company = (
+        rnd_sar_rows.groupby(SapBwColumns.CompanyCode, sort=False)[
+            SapBwColumns.Amount
+        ]
+        .first()
+        .to_dict()
+    )
+
     context = PipelineContext(
         grand_totals=df_grand_totals,
         royalties=df_royalties,
+        royalty_expense_by_company=royalty_expense_by_company,
         otp_pnl=df_otp,
         gsdivbu_model=etl_gsdivbu_model,
         gsdivbu_charges=etl_gsdivbu_charges,
         gsdivbu_charges_df=df_gsdivbu_charges,
         rnd_services=df_rnd_services,
+        rnd_sar_cost_by_company=rnd_sar_cost_by_company,
     )
     logger.info("pipeline_context_created")
 
     df_otp_enhanced = etl_otp_pnl.transform_and_enhance(segment_config)
+    # same for the enhanced frame: CompanyCode feeds the company loop
+    # partition, Category the handler membership masks and OrgBU the
+    # business-unit filters, which saves each handler converting the
+    # column itself; all three are low-cardinality and only read
+    # downstream
+    for col in (
+        OtpSegmentedPnlColumns.CompanyCode,
+        OtpSegmentedPnlColumns.Category,
+        OtpSegmentedPnlColumns.OrgBU,
+    ):
+        df_otp_enhanced[col] = df_otp_enhanced[col].astype("category")
     return context, df_otp_enhanced
 
 
+def _process_company(
+    company_code: str,
+    dfc: pd.DataFrame,
+    company_conf,
+    context: PipelineContext,
+    logger,
+) -> pd.DataFrame:
+    """Run one company's pipeline over its slice of the enhanced frame.
+
+    Sets the per-company fields on the given context, builds the
+    matching pipeline and returns the processed frame. Extracted to
+    module level so the company loop can run the iterations either
+    inline or on worker processes.
+    """
+    context.relevant_gsdiv_bus = None
+    context.external_cost_business_units = None
+    context.target_ebit_erosion = None
+
+    context.company_code = company_code
+    # the context is reused across companies, so the cached upper-cased
+    # code must be dropped alongside the assignment
+    context.__dict__.pop("company_code_upper", None)
+    structlog.contextvars.bind_contextvars(company_code=company_code)
+    # one info event carrying the loaded per-company config instead of
+    # one record per field; each record costs a full processor-chain
+    # pass and a sink write
+    info = {"company_code": company_code}
+    if company_conf:
+        context.relevant_gsdiv_bus = company_conf.shared_costs_business_units
+        if context.relevant_gsdiv_bus:
+            info["relevant_gsdiv_bus"] = context.relevant_gsdiv_bus
+        context.external_cost_business_units = (
+            company_conf.external_costs_business_units
+        )
+        if context.external_cost_business_units:
+            info["external_cost_business_units"] = (
+                context.external_cost_business_units
+            )
+        context.target_ebit_erosion = company_conf.target_ebit_erosion
+        if context.target_ebit_erosion is not None:
+            info["target_ebit_erosion"] = context.target_ebit_erosion
+    logger.info("company_processing_begin", **info)
+
+    pipeline = PipelineFactory.build_pipeline(dfc, context, pipeline_config)
+    logger.debug("built_pipeline", company_code=company_code)
+
+    processed = pipeline.process()
+    logger.info(
+        "company_processing_end",
+        company_code=company_code,
+        rows=len(processed),
+    )
+    return processed
+
+
+# per-worker state for the parallel company loop; the context is shipped
+# once per worker via the pool initializer instead of once per task
+_worker_context: Optional[PipelineContext] = None
+
+
+def _init_worker(context: PipelineContext) -> None:
+    global _worker_context
+    _worker_context = context
+    # workers inherit the parent's queue-based logging whose listener
+    # thread does not survive the fork; log straight to stderr instead
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processor=structlog.dev.ConsoleRenderer(),
+        )
+    )
+    logging.getLogger().handlers = [console_handler]
+
+
+def _process_company_in_worker(
+    company_code: str, dfc: pd.DataFrame
+) -> pd.DataFrame:
+    company_conf = _COMPANY_CONFIG_LOOKUP.get(company_code)
+    assert _worker_context is not None
+    return _process_company(
+        company_code,
+        dfc,
+        company_conf,
+        _worker_context,
+        structlog.get_logger(__name__),
+    )
+
+
 def run_with_context(
     company_codes: List[str], debug: bool
 ) -> tuple[pd.DataFrame, PipelineContext]:
@@ -107,74 +252,77 @@ def run_with_context(
     try:
         context, df_otp_enhanced = _build_pipeline_context(logger)
 
-        df_ok = pd.DataFrame()
-        company_config_lookup = {
-            conf.company_code.upper(): conf for conf in company_config
-        }
-
-        for company_code in company_codes:
-            logger.info("starting_company_processing", company_code=company_code)
-            context.relevant_gsdiv_bus = None
-            context.external_cost_business_units = None
-            context.target_ebit_erosion = None
-
-            context.company_code = company_code
-            structlog.contextvars.bind_contextvars(company_code=company_code)
-            company_conf = company_config_lookup.get(company_code)
-            if company_conf:
-                context.relevant_gsdiv_bus = company_conf.shared_costs_business_units
-                if context.relevant_gsdiv_bus:
-                    logger.info(
-                        "loaded_relevant_gsdiv_bus",
-                        company_code=company_code,
-                        relevant_gsdiv_bus=context.relevant_gsdiv_bus,
-                    )
-                context.external_cost_business_units = (
-                    company_conf.external_costs_business_units
-                )
-                if context.external_cost_business_units:
-                    logger.info(
-                        "loaded_external_cost_business_units",
-                        company_code=company_code,
-                        external_cost_business_units=context.external_cost_business_units,
-                    )
-                context.target_ebit_erosion = company_conf.target_ebit_erosion
-                if context.target_ebit_erosion is not None:
-                    logger.info(
-                        "loaded_target_ebit_erosion",
-                        company_code=company_code,
-                        target_ebit_erosion=context.target_ebit_erosion,
-                    )
+        processed_frames: List[pd.DataFrame] = []
 
-            if TYPE_CHECKING:
-                assert isinstance(context.otp_pnl, pd.DataFrame)
-
-            dfc = df_otp_enhanced.copy()
-            dfc = dfc[dfc[OtpSegmentedPnlColumns.CompanyCode] == company_code]
-
-            if TYPE_CHECKING:
-                assert isinstance(dfc, pd.DataFrame)
-
-            pipeline = PipelineFactory.build_pipeline(dfc, context, pipeline_config)
-            logger.info("built_pipeline", company_code=company_code)
+        # partition the enhanced frame once; each iteration then fetches
+        # its company slice from the dict instead of copying and scanning
+        # the full frame per company code
+        company_groups = dict(
+            iter(
+                df_otp_enhanced.groupby(
+                    OtpSegmentedPnlColumns.CompanyCode, sort=False
+                )
+            )
+        )
 
-            processed = pipeline.process()
-            logger.info(
-                "pipeline_processed",
-                company_code=company_code,
-                rows=len(processed),
+        if TYPE_CHECKING:
+            assert isinstance(context.otp_pnl, pd.DataFrame)
+
+        # copy-on-write makes the group slices safe to hand to the
+        # pipelines as-is: handler writes copy only the columns they
+        # touch, and the parent frame is never affected
+        company_slices = [
+            (
+                company_code,
+                company_groups.get(company_code, df_otp_enhanced.iloc[:0]),
             )
-            df_ok = pd.concat([df_ok, processed], axis=0)
+            for company_code in company_codes
+        ]
+
+        if app_config.max_workers > 1 and len(company_slices) > 1:
+            # the company iterations are independent: each worker gets
+            # the context once via the initializer and one company slice
+            # per task, and the ordered results are concatenated below
+            with ProcessPoolExecutor(
+                max_workers=app_config.max_workers,
+                initializer=_init_worker,
+                initargs=(context,),
+            ) as executor:
+                processed_frames = list(
+                    executor.map(
+                        _process_company_in_worker,
+                        *zip(*company_slices),
+                    )
+                )
+        else:
+            for company_code, dfc in company_slices:
+                processed_frames.append(
+                    _process_company(
+                        company_code,
+                        dfc,
+                        _COMPANY_CONFIG_LOOKUP.get(company_code),
+                        context,
+                        logger,
+                    )
+                )
 
         logger.info("completed_company_processing", company_codes=company_codes)
 
-        # Exclude processed company codes from the temp dataframe
+        # Exclude processed company codes by reusing the partition built
+        # above instead of a second full-frame isin scan
         processed_codes = set(company_codes)
-        temp = df_otp_enhanced[
-            ~df_otp_enhanced[OtpSegmentedPnlColumns.CompanyCode].isin(processed_codes)  # type:ignore
+        temp_frames = [
+            frame
+            for code, frame in company_groups.items()
+            if code not in processed_codes
         ]
+        temp = (
+            pd.concat(temp_frames) if temp_frames else df_otp_enhanced.iloc[:0]
+        )
 
-        res = pd.concat([temp, df_ok], ignore_index=True)
+        # single concat instead of growing an accumulator frame per
+        # iteration, which recopied all prior results each time
+        res = pd.concat([temp, *processed_frames], ignore_index=True)
 
         if TYPE_CHECKING:
             assert isinstance(res, pd.DataFrame)
@@ -0,0 +1,63 @@
+"""Shared handler-spec helpers for the pipeline modules.
+
+A handler spec is a (handler class, extra args, extra kwargs) triple;
+each pipeline builds a tuple of specs per run and instantiates the
+handlers against its working frame. The no-argument entries are
+materialized once at import time and shared across runs; per-company
+entries are resolved from the context each run instead of rebuilding
+the whole config list.
+"""
+
+from typing import Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from app.handlers import (
+    CogsHandler,
+    GsDivbuHandler,
+    OtherExpenseHandler,
+    OtherIncomeHandler,
+    RecalculateTotals,
+    SalesMarketingHandler,
+    UnusualItemsHandler,
+    VaInventoryReceivablesHandler,
+    VarianceHandler,
+)
+from app.interfaces import SegmentationHandler
+
+from .context import PipelineContext
+
+HandlerSpec = Tuple[Type[SegmentationHandler], Tuple, Dict]
+
+NO_ARGS: Tuple = ()
+NO_KWARGS: Dict = {}
+
+# the no-argument handlers every pipeline runs first, in their fixed order
+STATIC_SPECS: Tuple[HandlerSpec, ...] = (
+    (CogsHandler, NO_ARGS, NO_KWARGS),
+    (VaInventoryReceivablesHandler, NO_ARGS, NO_KWARGS),
+    (VarianceHandler, NO_ARGS, NO_KWARGS),
+    (OtherExpenseHandler, NO_ARGS, NO_KWARGS),
+    (OtherIncomeHandler, NO_ARGS, NO_KWARGS),
+    (UnusualItemsHandler, NO_ARGS, NO_KWARGS),
+)
+
+SALES_MARKETING_SPEC: HandlerSpec = (SalesMarketingHandler, NO_ARGS, NO_KWARGS)
+
+
+def gsdivbu_spec(
+    ctx: PipelineContext, cat_mask: Optional[np.ndarray] = None
+) -> HandlerSpec:
+    return (
+        GsDivbuHandler,
+        (ctx.company_code, ctx.gsdivbu_model, ctx.gsdivbu_charges),
+        NO_KWARGS if cat_mask is None else {"cat_mask": cat_mask},
+    )
+
+
+def recalculate_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        RecalculateTotals,
+        (ctx.otp_pnl,),
+        {"company_code": ctx.company_code},
+    )
@@ -1,3 +1,5 @@
+import logging
+
 import pandas as pd
 import structlog
 
@@ -10,39 +12,68 @@ from .context import PipelineContext
 class BasePipeline(Pipeline):
     def __init__(self, df: pd.DataFrame, context: PipelineContext) -> None:
         self.logger = structlog.get_logger(f"{__name__}.{type(self).__name__}")
+        # checked once so the per-handler debug events skip the structlog
+        # processor chain entirely when debug logging is off (same
+        # pattern as BaseHandler)
+        self._debug_enabled = logging.getLogger(
+            type(self).__module__
+        ).isEnabledFor(logging.DEBUG)
         self.df = df
+        self.context = context
 
         assert isinstance(context.company_code, str)
-        self.company_code = context.company_code
 
-        self.df_ok = pd.DataFrame()
+        # handlers mutate their frame in place and return it, so the
+        # working frame starts as the input and the pipelines skip the
+        # first-iteration branch
+        self.df_ok = df
         self.logger.info("pipeline_initialized", company_code=self.company_code)
         self.logger.debug("input_dataframe_shape", shape=self.df.shape)
         self._check()
 
+    # read through the context instead of duplicating the values on the
+    # instance; company_code_upper stays cached on the context itself
+    @property
+    def company_code(self) -> str:
+        assert isinstance(self.context.company_code, str)
+        return self.context.company_code
+
+    @property
+    def company_code_upper(self) -> str:
+        return self.context.company_code_upper
+
     def process(self) -> pd.DataFrame: ...
 
     def _check(self) -> None:
         self.logger.debug("validation_checks_started")
-        uniqs = self.df[OtpSegmentedPnlColumns.CompanyCode].unique()
+        col = self.df[OtpSegmentedPnlColumns.CompanyCode]
+
+        # one vectorized equality pass instead of hashing every row into
+        # a unique set; the set is only materialized for the error path
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            values = col.cat.codes.to_numpy()
+        else:
+            values = col.to_numpy()
+        is_single = len(values) > 0 and bool((values == values[0]).all())
 
-        if len(uniqs) != 1:
+        if not is_single:
             self.logger.error(
                 "multiple_company_codes_in_dataframe",
-                company_codes=uniqs,
+                company_codes=col.unique(),
             )
-        assert len(uniqs) == 1, (
-            f"Dataframe passed is not unique for the entity - {uniqs}"
+        assert is_single, (
+            f"Dataframe passed is not unique for the entity - {col.unique()}"
         )
 
-        if uniqs[0].upper() != self.company_code.upper():
+        company_code = str(col.iloc[0])
+        if company_code.upper() != self.company_code_upper:
             self.logger.error(
                 "company_code_mismatch",
-                dataframe_company_code=uniqs[0],
+                dataframe_company_code=company_code,
                 expected_company_code=self.company_code,
             )
-        assert uniqs[0].upper() == self.company_code.upper(), (
-            f"Dataframe passed is not reflective of the company_code passed - {uniqs[0]} != {self.company_code}"
+        assert company_code.upper() == self.company_code_upper, (
+            f"Dataframe passed is not reflective of the company_code passed - {company_code} != {self.company_code}"
         )
 
         self.logger.info("validation_checks_passed")
@@ -1,30 +1,82 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple, Type
+import functools
+from typing import Dict, Tuple
 
 import pandas as pd
-import structlog
 
 from app.enums import Category
 from app.handlers import (
     AdminHandler,
-    CogsHandler,
-    GsDivbuHandler,
-    OtherExpenseHandler,
-    OtherIncomeHandler,
-    RecalculateTotals,
     RndHandler,
     SalesMarketingHandler,
-    VaInventoryReceivablesHandler,
-    VarianceHandler,
     filters,
 )
 from app.handlers.royalty_handler import RoyaltyHandler
-from app.handlers.unusual_items_handler import UnusualItemsHandler
-from app.interfaces import SegmentationHandler
 
+from ._specs import (
+    NO_ARGS,
+    NO_KWARGS,
+    SALES_MARKETING_SPEC,
+    STATIC_SPECS,
+    HandlerSpec,
+    gsdivbu_spec,
+    recalculate_spec,
+)
 from .base import BasePipeline
 from .context import PipelineContext
 
 
+def _royalty_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        RoyaltyHandler,
+        (ctx.company_code, ctx.royalties),
+        {"royalty_expense_by_company": ctx.royalty_expense_by_company},
+    )
+
+
+def _rnd_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        RndHandler,
+        (ctx.company_code,),
+        {
+            "df_rnd_services": ctx.rnd_services,
+            "rnd_sar_cost_by_company": ctx.rnd_sar_cost_by_company,
+        },
+    )
+
+
+def _admin_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        AdminHandler,
+        NO_ARGS,
+        {
+            "company_code": ctx.company_code,
+            "df_royalty": ctx.royalties,
+            "royalty_expense_by_company": ctx.royalty_expense_by_company,
+        },
+    )
+
+
+def _with_extra_kwargs(spec: HandlerSpec, extra: Dict) -> HandlerSpec:
+    handler_cls, extra_args, extra_kwargs = spec
+    return (handler_cls, extra_args, {**extra_kwargs, **extra})
+
+
+# special-case kwargs for the external-cost handlers; the no-units
+# default routes nothing and is shared across runs
+_OWN_MFG_TP_ISIN = [Category.OwnManufacturingThirdParty]
+_DEFAULT_SPECIAL_KWARGS: Dict = {
+    "filter_func": pd.Series,
+    "isin": _OWN_MFG_TP_ISIN,
+}
+
+
+@functools.cache
+def _business_unit_filter(business_units: Tuple[str, ...]):
+    return filters.create_business_unit_category_filter(
+        business_units=list(business_units)
+    )
+
+
 class EntrepreneurWithRoutinePipeline(BasePipeline):
     """Pipeline implementation for entrepreneur and routine segmentation
 
@@ -38,19 +90,6 @@ class EntrepreneurWithRoutinePipeline(BasePipeline):
         context: The PipelineContext providing shared data loaders and company code.
     """
 
-    def __init__(self, df: pd.DataFrame, context: PipelineContext) -> None:
-        self.context = context
-        if TYPE_CHECKING:
-            assert isinstance(context.company_code, str)
-
-        super().__init__(df, context)
-        self.logger = structlog.get_logger(f"{__name__}.{type(self).__name__}")
-        self.logger.info(
-            "pipeline_initialized",
-            pipeline=type(self).__name__,
-            company_code=context.company_code,
-        )
-
     def process(self) -> pd.DataFrame:
         """Process the input DataFrame by sequentially applying segmentation handlers.
 
@@ -67,76 +106,44 @@ class EntrepreneurWithRoutinePipeline(BasePipeline):
             Any exceptions raised by individual handler instantiation or process() calls,
             such as missing data, invalid configurations, or transformation errors.
         """
-        self.logger.info(
+        # bind the pipeline name once instead of re-sending it with every
+        # per-handler event
+        log = self.logger.bind(pipeline=type(self).__name__)
+        ctx = self.context
+        log.info(
             "pipeline_processing_started",
-            pipeline=type(self).__name__,
-            company_code=self.context.company_code,
+            company_code=ctx.company_code,
+        )
+        # Handler configurations: (class, extra_args, extra_kwargs); the
+        # static entries are shared module-level tuples
+        handler_configs: Tuple[HandlerSpec, ...] = (
+            *STATIC_SPECS,
+            SALES_MARKETING_SPEC,
+            _rnd_spec(ctx),
+            gsdivbu_spec(ctx),
+            _royalty_spec(ctx),
+            _admin_spec(ctx),
+            recalculate_spec(ctx),
         )
-        # Store handler configurations: (class, extra_args, extra_kwargs)
-        handler_configs: List[Tuple[Type[SegmentationHandler], List, Dict]] = [
-            (CogsHandler, [], {}),
-            (VaInventoryReceivablesHandler, [], {}),
-            (VarianceHandler, [], {}),
-            (OtherExpenseHandler, [], {}),
-            (OtherIncomeHandler, [], {}),
-            (UnusualItemsHandler, [], {}),
-            (SalesMarketingHandler, [], {}),
-            (
-                RndHandler,
-                [self.context.company_code],
-                {"df_rnd_services": self.context.rnd_services},
-            ),
-            (
-                GsDivbuHandler,
-                [
-                    self.context.company_code,
-                    self.context.gsdivbu_model,
-                    self.context.gsdivbu_charges,
-                ],
-                {},
-            ),
-            (
-                RoyaltyHandler,
-                [self.context.company_code, self.context.royalties],
-                {},
-            ),
-            (
-                AdminHandler,
-                [],
-                {
-                    "company_code": self.context.company_code,
-                    "df_royalty": self.context.royalties,
-                },
-            ),
-            (
-                RecalculateTotals,
-                [self.context.otp_pnl],
-                {"company_code": self.context.company_code},
-            ),
-        ]
-
-        for i, (handler_cls, extra_args, extra_kwargs) in enumerate(handler_configs):
-            # First argument is always the dataframe
-            df_to_use = self.df if i == 0 else self.df_ok
-
-            # Instantiate with df + any extra parameters
-            handler = handler_cls(df_to_use, *extra_args, **extra_kwargs)
-            self.logger.debug(
-                "handler_processing_started",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
-            )
+
+        for handler_cls, extra_args, extra_kwargs in handler_configs:
+            # the working frame is seeded with the input in BasePipeline
+            handler = handler_cls(self.df_ok, *extra_args, **extra_kwargs)
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_started",
+                    handler=handler_cls.__name__,
+                )
             processed_df = handler.process()
             self.df_ok = processed_df
-            self.logger.debug(
-                "handler_processing_completed",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
-            )
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_completed",
+                    handler=handler_cls.__name__,
+                )
 
-        self.logger.info(
+        log.info(
             "pipeline_processing_completed",
-            pipeline=type(self).__name__,
             final_shape=self.df_ok.shape,
         )
         return self.df_ok
@@ -155,19 +162,6 @@ class EntrepreneurWithRoutineAndExternalCosts(BasePipeline):
         context: The PipelineContext providing shared data loaders and company code.
     """
 
-    def __init__(self, df: pd.DataFrame, context: PipelineContext) -> None:
-        self.context = context
-        if TYPE_CHECKING:
-            assert isinstance(context.company_code, str)
-
-        super().__init__(df, context)
-        self.logger = structlog.get_logger(f"{__name__}.{type(self).__name__}")
-        self.logger.info(
-            "pipeline_initialized",
-            pipeline=type(self).__name__,
-            company_code=context.company_code,
-        )
-
     def process(self) -> pd.DataFrame:
         """Process the input DataFrame by sequentially applying segmentation handlers.
 
@@ -184,114 +178,61 @@ class EntrepreneurWithRoutineAndExternalCosts(BasePipeline):
             Any exceptions raised by individual handler instantiation or process() calls,
             such as missing data, invalid configurations, or transformation errors.
         """
-        self.logger.info(
+        # bind the pipeline name once instead of re-sending it with every
+        # per-handler event
+        log = self.logger.bind(pipeline=type(self).__name__)
+        ctx = self.context
+        log.info(
             "pipeline_processing_started",
-            pipeline=type(self).__name__,
-            company_code=self.context.company_code,
+            company_code=ctx.company_code,
         )
-        # Create filter for business units to route to OWN_MANUFACTURING_THIRD_PARTY
-
-        business_units = self.context.external_cost_business_units
-        special_kwargs = {
-            "filter_func": pd.Series,
-            "isin": [Category.OwnManufacturingThirdParty],
-        }
-
+        # Create filter for business units to route to OWN_MANUFACTURING_THIRD_PARTY;
+        # the no-units default is a shared constant and the real filter is
+        # memoized per business-unit tuple instead of rebuilt every run
+        business_units = ctx.external_cost_business_units
         if business_units:
-            special_kwargs["filter_func"] = (
-                filters.create_business_unit_category_filter(
-                    business_units=list(business_units) if business_units else []
-                )
-            )
-
-        # Store handler configurations: (class, extra_args, extra_kwargs)
-        handler_configs: List[Tuple[Type[SegmentationHandler], List, Dict]] = [
-            (CogsHandler, [], {}),
-            (VaInventoryReceivablesHandler, [], {}),
-            (VarianceHandler, [], {}),
-            (OtherExpenseHandler, [], {}),
-            (OtherIncomeHandler, [], {}),
-            (UnusualItemsHandler, [], {}),
-            (
-                GsDivbuHandler,
-                [
-                    self.context.company_code,
-                    self.context.gsdivbu_model,
-                    self.context.gsdivbu_charges,
-                ],
-                {},
-            ),
-            (
-                RoyaltyHandler,
-                [self.context.company_code, self.context.royalties],
-                {},
-            ),
+            special_kwargs: Dict = {
+                "filter_func": _business_unit_filter(tuple(business_units)),
+                "isin": _OWN_MFG_TP_ISIN,
+            }
+        else:
+            special_kwargs = _DEFAULT_SPECIAL_KWARGS
+
+        # Handler configurations: (class, extra_args, extra_kwargs); the
+        # static entries are shared module-level tuples and the special
+        # cases reuse the per-company builders with the filter merged in
+        handler_configs: Tuple[HandlerSpec, ...] = (
+            *STATIC_SPECS,
+            gsdivbu_spec(ctx),
+            _royalty_spec(ctx),
             # process special cases
-            (
-                SalesMarketingHandler,
-                [],
-                {**special_kwargs},
-            ),
-            (
-                RndHandler,
-                [self.context.company_code],
-                {
-                    "df_rnd_services": self.context.rnd_services,
-                    **special_kwargs,
-                },
-            ),
-            (
-                AdminHandler,
-                [],
-                {
-                    "company_code": self.context.company_code,
-                    "df_royalty": self.context.royalties,
-                    **special_kwargs,
-                },
-            ),
-            (SalesMarketingHandler, [], {}),
-            (
-                RndHandler,
-                [self.context.company_code],
-                {"df_rnd_services": self.context.rnd_services},
-            ),
-            (
-                AdminHandler,
-                [],
-                {
-                    "company_code": self.context.company_code,
-                    "df_royalty": self.context.royalties,
-                },
-            ),
-            (
-                RecalculateTotals,
-                [self.context.otp_pnl],
-                {"company_code": self.context.company_code},
-            ),
-        ]
-
-        for i, (handler_cls, extra_args, extra_kwargs) in enumerate(handler_configs):
-            # First argument is always the dataframe
-            df_to_use = self.df if i == 0 else self.df_ok
-
-            # Instantiate with df + any extra parameters
-            handler = handler_cls(df_to_use, *extra_args, **extra_kwargs)
-            self.logger.debug(
-                "handler_processing_started",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
-            )
+            (SalesMarketingHandler, NO_ARGS, special_kwargs),
+            _with_extra_kwargs(_rnd_spec(ctx), special_kwargs),
+            _with_extra_kwargs(_admin_spec(ctx), special_kwargs),
+            SALES_MARKETING_SPEC,
+            _rnd_spec(ctx),
+            _admin_spec(ctx),
+            recalculate_spec(ctx),
+        )
+
+        for handler_cls, extra_args, extra_kwargs in handler_configs:
+            # the working frame is seeded with the input in BasePipeline
+            handler = handler_cls(self.df_ok, *extra_args, **extra_kwargs)
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_started",
+                    handler=handler_cls.__name__,
+                )
             processed_df = handler.process()
             self.df_ok = processed_df
-            self.logger.debug(
-                "handler_processing_completed",
-                pipeline=type(self).__name__,
-                handler=type(handler).__name__,
-            )
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_completed",
+                    handler=handler_cls.__name__,
+                )
 
-        self.logger.info(
+        log.info(
             "pipeline_processing_completed",
-            pipeline=type(self).__name__,
             final_shape=self.df_ok.shape,
         )
         return self.df_ok
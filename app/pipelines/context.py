@@ -1,4 +1,6 @@
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Sequence
 
 import pandas as pd
@@ -17,5 +19,16 @@ class PipelineContext:
     otp_pnl: Optional[pd.DataFrame] = None
     relevant_gsdiv_bus: Optional[Sequence[str]] = None
     rnd_services: Optional[pd.DataFrame] = None
+    # per-company scalars derived once from rnd_services/royalties so the
+    # handlers look them up instead of rescanning the frames per company
+    rnd_sar_cost_by_company: Optional[dict] = None
     royalties: Optional[pd.DataFrame] = None
+    royalty_expense_by_company: Optional[dict] = None
     target_ebit_erosion: Optional[float] = None
+
+    @cached_property
+    def company_code_upper(self) -> str:
+        # interned so the repeated set-membership checks against the
+        # config entity sets hash a cached pointer instead of the string
+        assert isinstance(self.company_code, str)
+        return sys.intern(self.company_code.upper())
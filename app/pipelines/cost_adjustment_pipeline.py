@@ -1,30 +1,47 @@
-from typing import Dict, List, Tuple, Type
+from typing import Tuple
 
 import pandas as pd
 import structlog
 
-from app.handlers import (
-    AdminHandler,
-    CogsHandler,
-    GsDivbuHandler,
-    OtherExpenseHandler,
-    OtherIncomeHandler,
-    RecalculateTotals,
-    SalesMarketingHandler,
-    VaInventoryReceivablesHandler,
-    VarianceHandler,
-)
+from app.handlers import AdminHandler
 from app.handlers.manual_sar_adjustment_handler import (
     ManualEbitErosionAdjustmentHandler,
 )
 from app.handlers.royalty_handler import RoyaltyHandler
-from app.handlers.unusual_items_handler import UnusualItemsHandler
-from app.interfaces import SegmentationHandler
 
+from ._specs import (
+    NO_ARGS,
+    NO_KWARGS,
+    SALES_MARKETING_SPEC,
+    STATIC_SPECS,
+    HandlerSpec,
+    gsdivbu_spec,
+    recalculate_spec,
+)
 from .base import BasePipeline
 from .context import PipelineContext
 
 
+def _royalty_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (RoyaltyHandler, (ctx.company_code, ctx.royalties), NO_KWARGS)
+
+
+def _admin_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        AdminHandler,
+        NO_ARGS,
+        {"company_code": ctx.company_code, "df_royalty": ctx.royalties},
+    )
+
+
+def _erosion_spec(ctx: PipelineContext) -> HandlerSpec:
+    return (
+        ManualEbitErosionAdjustmentHandler,
+        (ctx.otp_pnl, ctx.target_ebit_erosion),
+        NO_KWARGS,
+    )
+
+
 class CostAdjustmentPipeline(BasePipeline):
     """Cost Adjustment Pipeline
 
@@ -38,11 +55,6 @@ class CostAdjustmentPipeline(BasePipeline):
         context: The PipelineContext providing shared data loaders and company code.
     """
 
-    def __init__(self, df: pd.DataFrame, context: PipelineContext) -> None:
-        self.context = context
-        self.logger = structlog.get_logger(f"{__name__}.{type(self).__name__}")
-        super().__init__(df, context)
-
     def process(self) -> pd.DataFrame:
         """Process the input DataFrame by sequentially applying segmentation handlers.
 
@@ -59,90 +71,58 @@ class CostAdjustmentPipeline(BasePipeline):
             Any exceptions raised by individual handler instantiation or process() calls,
             such as missing data, invalid configurations, or transformation errors.
         """
-        self.logger.info(
+        # bind the pipeline name once instead of re-sending it with every
+        # per-handler event
+        log = self.logger.bind(pipeline=type(self).__name__)
+        ctx = self.context
+        log.info(
             "pipeline_processing_started",
-            pipeline=type(self).__name__,
-            company_code=self.context.company_code,
+            company_code=ctx.company_code,
+        )
+        # Handler configurations: (class, extra_args, extra_kwargs); the
+        # static entries are shared module-level tuples
+        handler_configs: Tuple[HandlerSpec, ...] = (
+            *STATIC_SPECS,
+            SALES_MARKETING_SPEC,
+            gsdivbu_spec(ctx),
+            _royalty_spec(ctx),
+            _admin_spec(ctx),
+            recalculate_spec(ctx),
         )
-        # Store handler configurations: (class, extra_args, extra_kwargs)
-        handler_configs: List[Tuple[Type[SegmentationHandler], List, Dict]] = [
-            (CogsHandler, [], {}),
-            (VaInventoryReceivablesHandler, [], {}),
-            (VarianceHandler, [], {}),
-            (OtherExpenseHandler, [], {}),
-            (OtherIncomeHandler, [], {}),
-            (UnusualItemsHandler, [], {}),
-            (SalesMarketingHandler, [], {}),
-            (
-                GsDivbuHandler,
-                [
-                    self.context.company_code,
-                    self.context.gsdivbu_model,
-                    self.context.gsdivbu_charges,
-                ],
-                {},
-            ),
-            (
-                RoyaltyHandler,
-                [self.context.company_code, self.context.royalties],
-                {},
-            ),
-            (
-                AdminHandler,
-                [],
-                {
-                    "company_code": self.context.company_code,
-                    "df_royalty": self.context.royalties,
-                },
-            ),
-            (
-                RecalculateTotals,
-                [self.context.otp_pnl],
-                {"company_code": self.context.company_code},
-            ),
-            (
-                ManualEbitErosionAdjustmentHandler,
-                [self.context.otp_pnl, self.context.target_ebit_erosion],
-                {},
-            ),
-            (
-                RecalculateTotals,
-                [self.context.otp_pnl],
-                {"company_code": self.context.company_code},
-            ),
-        ]
-
-        for i, (handler_cls, extra_args, extra_kwargs) in enumerate(handler_configs):
-            # First argument is always the dataframe
-            df_to_use = self.df if i == 0 else self.df_ok
-
-            # Instantiate with df + any extra parameters
-            handler = handler_cls(df_to_use, *extra_args, **extra_kwargs)
-            self.logger.debug(
-                "handler_processing_started",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
+
+        # the erosion adjustment only applies when a target is
+        # configured for the entity; skipping it here keeps exceptions
+        # for real failures instead of expected-missing-config control
+        # flow
+        if ctx.target_ebit_erosion is not None:
+            handler_configs += (
+                _erosion_spec(ctx),
+                recalculate_spec(ctx),
             )
-            try:
-                processed_df = handler.process()
-                self.df_ok = processed_df
-                self.logger.debug(
-                    "handler_processing_completed",
-                    pipeline=type(self).__name__,
+        else:
+            log.warning(
+                "manual_erosion_skipped",
+                reason="no_target_ebit_erosion",
+            )
+
+        for handler_cls, extra_args, extra_kwargs in handler_configs:
+            # the working frame is seeded with the input in BasePipeline
+            handler = handler_cls(self.df_ok, *extra_args, **extra_kwargs)
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_started",
                     handler=handler_cls.__name__,
                 )
-            except Exception as e:
-                self.logger.error(
-                    "handler_processing_failed",
-                    pipeline=type(self).__name__,
+            processed_df = handler.process()
+            self.df_ok = processed_df
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_completed",
                     handler=handler_cls.__name__,
-                    error=str(e),
                 )
-                continue
 
-        self.logger.info(
+        log.info(
             "pipeline_processing_completed",
-            pipeline=type(self).__name__,
             final_shape=self.df_ok.shape,
         )
         return self.df_ok
@@ -3,15 +3,7 @@ import pandas as pd
 from app.config import PipelineConfig
 from app.interfaces import Pipeline
 
-from .complex import (
-    EntrepreneurWithRoutineAndExternalCosts,
-    EntrepreneurWithRoutinePipeline,
-)
 from .context import PipelineContext
-from .cost_adjustment_pipeline import CostAdjustmentPipeline
-from .single_economic_activity import (
-    SingleEconomicActivityPipeline,
-)
 
 
 class PipelineFactory:
@@ -46,21 +38,12 @@ class PipelineFactory:
             NotImplementedError: If the company code is not supported.
         """
         assert isinstance(context.company_code, str)
-        entity = context.company_code.upper()
+        entity = context.company_code_upper
 
-        if entity in config.mixed_activity_with_external_costs:
-            return EntrepreneurWithRoutineAndExternalCosts(df, context)
-
-        elif entity in config.manual_erosion_entities:
-            return CostAdjustmentPipeline(df, context)
-
-        elif entity in config.mixed_activity:
-            return EntrepreneurWithRoutinePipeline(df, context)
-
-        elif entity in config.single_activity:
-            return SingleEconomicActivityPipeline(df, context)
-
-        else:
+        # one dict lookup instead of four sequential set-membership tests
+        pipeline_cls = config.pipeline_dispatch.get(entity)
+        if pipeline_cls is None:
             raise NotImplementedError(
                 f"Company code {context.company_code} has not been yet implemented"
             )
+        return pipeline_cls(df, context)
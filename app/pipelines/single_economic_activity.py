@@ -1,27 +1,33 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple, Type
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
-import structlog
-
-from app.enums import Category
-from app.handlers import (
-    AdminHandler,
-    CogsHandler,
-    GsDivbuHandler,
-    OtherExpenseHandler,
-    OtherIncomeHandler,
-    RecalculateTotals,
-    RndHandler,
-    SalesMarketingHandler,
-    UnusualItemsHandler,
-    VaInventoryReceivablesHandler,
-    VarianceHandler,
-)
-from app.interfaces import SegmentationHandler
 
+from app.enums import Category, OtpSegmentedPnlColumns
+from app.handlers import AdminHandler, RndHandler, SalesMarketingHandler
+
+from ._specs import (
+    NO_ARGS,
+    NO_KWARGS,
+    STATIC_SPECS,
+    HandlerSpec,
+    gsdivbu_spec,
+    recalculate_spec,
+)
 from .base import BasePipeline
 from .context import PipelineContext
 
+_RELEVANT_CATEGORIES = [
+    Category.ContractManufacturing,
+    Category.Distribution,
+    Category.OwnManufacturingIC,
+    Category.OwnManufacturingThirdParty,
+]
+
+
+def _rnd_spec(ctx: PipelineContext, cat_mask: np.ndarray) -> HandlerSpec:
+    return (RndHandler, (ctx.company_code,), {"cat_mask": cat_mask})
+
 
 class SingleEconomicActivityPipeline(BasePipeline):
     """Pipeline implementation for routine only segmentation.
@@ -34,14 +40,6 @@ class SingleEconomicActivityPipeline(BasePipeline):
         context: The PipelineContext providing shared data loaders and company code.
     """
 
-    def __init__(self, df: pd.DataFrame, context: PipelineContext) -> None:
-        self.context = context
-        if TYPE_CHECKING:
-            assert isinstance(context.company_code, str)
-
-        super().__init__(df, context)
-        self.logger = structlog.get_logger(f"{__name__}.{type(self).__name__}")
-
     def process(self) -> pd.DataFrame:
         """Process the input DataFrame by sequentially applying segmentation handlers.
 
@@ -52,78 +50,51 @@ class SingleEconomicActivityPipeline(BasePipeline):
             Any exceptions raised by individual handler instantiation or process() calls,
             such as missing data, invalid configurations, or transformation errors.
         """
-        self.logger.info(
+        # bind the pipeline name once instead of re-sending it with every
+        # per-handler event
+        log = self.logger.bind(pipeline=type(self).__name__)
+        ctx = self.context
+        log.info(
             "pipeline_processing_started",
-            pipeline=type(self).__name__,
-            company_code=self.context.company_code,
+            company_code=ctx.company_code,
+        )
+        # one Category scan shared by both masked handlers instead of an
+        # isin pass inside each handler's __init__
+        cat_mask = (
+            self.df[OtpSegmentedPnlColumns.Category]
+            .isin(_RELEVANT_CATEGORIES)
+            .to_numpy()
         )
-        # Store handler configurations: (class, extra_args, extra_kwargs)
-        handler_configs: List[Tuple[Type[SegmentationHandler], List, Dict]] = [
-            (CogsHandler, [], {}),
-            (VaInventoryReceivablesHandler, [], {}),
-            (VarianceHandler, [], {}),
-            (OtherExpenseHandler, [], {}),
-            (OtherIncomeHandler, [], {}),
-            (UnusualItemsHandler, [], {}),
-            (
-                GsDivbuHandler,
-                [
-                    self.context.company_code,
-                    self.context.gsdivbu_model,
-                    self.context.gsdivbu_charges,
-                ],
-                {
-                    "isin": [
-                        Category.ContractManufacturing,
-                        Category.Distribution,
-                        Category.OwnManufacturingIC,
-                        Category.OwnManufacturingThirdParty,
-                    ]
-                },
-            ),
-            (SalesMarketingHandler, [], {}),
-            (AdminHandler, [], {}),
-            (
-                RndHandler,
-                [self.context.company_code],
-                {
-                    "isin": [
-                        Category.ContractManufacturing,
-                        Category.Distribution,
-                        Category.OwnManufacturingIC,
-                        Category.OwnManufacturingThirdParty,
-                    ]
-                },
-            ),
-            (
-                RecalculateTotals,
-                [self.context.otp_pnl],
-                {"company_code": self.context.company_code},
-            ),
-        ]
-
-        for i, (handler_cls, extra_args, extra_kwargs) in enumerate(handler_configs):
-            # First argument is always the dataframe
-            df_to_use = self.df if i == 0 else self.df_ok
-
-            # Instantiate with df + any extra parameters
-            handler = handler_cls(df_to_use, *extra_args, **extra_kwargs)
-            self.logger.debug(
-                "handler_processing_started",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
-            )
+
+        # Handler configurations: (class, extra_args, extra_kwargs); the
+        # static entries are shared module-level tuples
+        handler_configs: Tuple[HandlerSpec, ...] = (
+            *STATIC_SPECS,
+            gsdivbu_spec(ctx, cat_mask),
+            (SalesMarketingHandler, NO_ARGS, NO_KWARGS),
+            (AdminHandler, NO_ARGS, NO_KWARGS),
+            _rnd_spec(ctx, cat_mask),
+            recalculate_spec(ctx),
+        )
+
+        for handler_cls, extra_args, extra_kwargs in handler_configs:
+            # the working frame is seeded with the input in BasePipeline
+            handler = handler_cls(self.df_ok, *extra_args, **extra_kwargs)
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_started",
+                    handler=handler_cls.__name__,
+                )
             processed_df = handler.process()
             self.df_ok = processed_df
-            self.logger.debug(
-                "handler_processing_completed",
-                pipeline=type(self).__name__,
-                handler=handler_cls.__name__,
-            )
+            if self._debug_enabled:
+                log.debug(
+                    "handler_processing_completed",
+                    handler=handler_cls.__name__,
+                )
 
-        self.logger.info(
+        log.info(
             "pipeline_processing_completed",
-            pipeline=type(self).__name__,
             final_shape=self.df_ok.shape,
         )
         return self.df_ok
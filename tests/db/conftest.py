@@ -0,0 +1,28 @@
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One in-memory engine with the schema created once for all db tests."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """Session inside an outer transaction rolled back on teardown.
+
+    create_savepoint turns the loaders' session.commit() into a
+    savepoint release, so each test's writes never outlive the test.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    with Session(
+        bind=connection, join_transaction_mode="create_savepoint"
+    ) as session:
+        yield session
+    transaction.rollback()
+    connection.close()
@@ -1,13 +1,15 @@
 from decimal import Decimal
 
 import pandas as pd
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel import select
 
 from app.db import models
 from app.db.load_templates import (
+    _amounts_to_milli,
     _line_item_label,
     _to_decimal,
     _to_int,
+    _to_milli,
     build_load_context,
     load_grand_totals,
     prepare_company_codes,
@@ -16,12 +18,6 @@ from app.db.load_templates import (
 from app.enums import HighLevelSegmentedPnlColumns, SapBwColumns
 
 
-def _session() -> Session:
-    engine = create_engine("sqlite://")
-    SQLModel.metadata.create_all(engine)
-    return Session(engine)
-
-
 def test_to_decimal_handles_none_and_nan():
     assert _to_decimal(None) == Decimal("0")
     assert _to_decimal(float("nan")) == Decimal("0")
@@ -34,6 +30,28 @@ def test_to_int_handles_none_nan_and_default():
     assert _to_int("42") == 42
 
 
+def test_to_milli_handles_none_nan_and_scales():
+    assert _to_milli(None) == 0
+    assert _to_milli(float("nan")) == 0
+    assert _to_milli("10.5") == 10500
+    assert _to_milli(1.2345) == 1234
+
+
+def test_amounts_to_milli_matches_scalar_path():
+    values = [None, float("nan"), "10.5", 1.2345, 0.0005, 0.0015, 0.0025, -0.0005, -1.0005]
+
+    result = _amounts_to_milli(pd.Series(values))
+
+    # half-even rounding included: both paths must agree cell for cell
+    assert result == [_to_milli(v) for v in values]
+
+
+def test_amount_property_round_trips_milli_units():
+    row = models.GrandTotal(amount_milli=_to_milli("10.5"))
+
+    assert row.amount == Decimal("10.5")
+
+
 def test_line_item_label_handles_enum_and_string():
     assert (
         _line_item_label(HighLevelSegmentedPnlColumns.TotalEBIT)
@@ -42,21 +60,20 @@ def test_line_item_label_handles_enum_and_string():
     assert _line_item_label("Custom Item") == "Custom Item"
 
 
-def test_prepare_company_codes_and_line_items_create_missing_rows():
-    with _session() as session:
-        company_map = prepare_company_codes(session, ["AA01", "BB02"])
-        line_item_map = prepare_line_items(session, ["Item A", "Item B"])
+def test_prepare_company_codes_and_line_items_create_missing_rows(session):
+    company_map = prepare_company_codes(session, ["AA01", "BB02"])
+    line_item_map = prepare_line_items(session, ["Item A", "Item B"])
 
-        assert set(company_map.keys()) == {"AA01", "BB02"}
-        assert set(line_item_map.keys()) == {"Item A", "Item B"}
+    assert set(company_map.keys()) == {"AA01", "BB02"}
+    assert set(line_item_map.keys()) == {"Item A", "Item B"}
 
-        companies = session.exec(select(models.CompanyCode)).all()
-        line_items = session.exec(select(models.LineItem)).all()
-        assert {c.code for c in companies} == {"AA01", "BB02"}
-        assert {li.name for li in line_items} == {"Item A", "Item B"}
+    companies = session.exec(select(models.CompanyCode)).all()
+    line_items = session.exec(select(models.LineItem)).all()
+    assert {c.code for c in companies} == {"AA01", "BB02"}
+    assert {li.name for li in line_items} == {"Item A", "Item B"}
 
 
-def test_build_load_context_creates_id_mappings():
+def test_build_load_context_creates_id_mappings(session):
     df = pd.DataFrame(
         {
             "company_code": ["AA01", "BB02"],
@@ -64,14 +81,13 @@ def test_build_load_context_creates_id_mappings():
         }
     )
 
-    with _session() as session:
-        ctx = build_load_context(session, df, "company_code", "line_item")
+    ctx = build_load_context(session, df, "company_code", "line_item")
 
-        assert set(ctx.company_code_id.keys()) == {"AA01", "BB02"}
-        assert set(ctx.line_item_id.keys()) == {"Item A", "Item B"}
+    assert set(ctx.company_code_id.keys()) == {"AA01", "BB02"}
+    assert set(ctx.line_item_id.keys()) == {"Item A", "Item B"}
 
 
-def test_load_grand_totals_inserts_rows_and_returns_count():
+def test_load_grand_totals_inserts_rows_and_returns_count(session):
     df = pd.DataFrame(
         {
             SapBwColumns.CompanyCode.value: ["AA01", "AA01"],
@@ -83,10 +99,9 @@ def test_load_grand_totals_inserts_rows_and_returns_count():
         }
     )
 
-    with _session() as session:
-        rows_loaded = load_grand_totals(session, df)
+    rows_loaded = load_grand_totals(session, df)
 
-        assert rows_loaded == 2
-        results = session.exec(select(models.GrandTotal)).all()
-        assert len(results) == 2
-        assert {row.amount for row in results} == {Decimal("100"), Decimal("50")}
+    assert rows_loaded == 2
+    results = session.exec(select(models.GrandTotal)).all()
+    assert len(results) == 2
+    assert {row.amount for row in results} == {Decimal("100"), Decimal("50")}
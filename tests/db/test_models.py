@@ -13,21 +13,21 @@ def _expected_columns():
             "id",
             "company_code_id",
             "line_item_id",
-            "amount",
+            "amount_milli",
             "created_on",
         },
         "sharedservicestotalcharge": {
             "id",
             "company_code_id",
             "line_item_id",
-            "amount",
+            "amount_milli",
             "created_on",
         },
         "grandtotal": {
             "id",
             "company_code_id",
             "line_item_id",
-            "amount",
+            "amount_milli",
             "created_on",
         },
         "intellectualpropertyservice": {
@@ -35,14 +35,14 @@ def _expected_columns():
             "company_code_id",
             "line_item_id",
             "account_number",
-            "amount",
+            "amount_milli",
         },
         "productbusiness": {
             "id",
             "company_code_id",
             "line_item_name",
             "line_item_id",
-            "amount",
+            "amount_milli",
         },
         "productbusinesssegmented": {
             "id",
@@ -50,7 +50,7 @@ def _expected_columns():
             "line_item_name",
             "line_item_id",
             "category",
-            "amount",
+            "amount_milli",
         },
     }
 
@@ -1,5 +1,3 @@
-import importlib
-
 import pandas as pd
 
 from app.enums import (
@@ -10,17 +8,6 @@ from app.enums import (
 )
 
 
-def _load_module(module_path: str, **config_attrs):
-    import app.config as config
-
-    for name, value in config_attrs.items():
-        if not hasattr(config, name):
-            setattr(config, name, value)
-
-    module = importlib.import_module(module_path)
-    return importlib.reload(module)
-
-
 def test_transform_grand_totals_df():
     from app.etl.loaders.grand_totals import transform_grand_totals_df
 
@@ -141,10 +128,7 @@ def test_transform_gs_divbu_income_and_model_df():
 
 
 def test_transform_otp_segmented_pnl_df():
-    otp_module = _load_module(
-        "app.etl.loaders.otp_segmented_pnl",
-        ActivitySegmentConfig=type("ActivitySegmentConfig", (), {}),
-    )
+    from app.etl.loaders import otp_segmented_pnl as otp_module
 
     headers = OtpSegmentedPnlColumns.list_values()[:-2]
     text_cols = set(OtpSegmentedPnlColumns.list_text_cols())
@@ -208,9 +192,7 @@ def test_transform_royalties_df():
 
 
 def test_transform_rnd_fr09_df():
-    rnd_module = _load_module(
-        "app.etl.loaders.rnd_service", RndConfig=type("RndConfig", (), {})
-    )
+    from app.etl.loaders import rnd_service as rnd_module
 
     df = pd.DataFrame(
         [
@@ -227,9 +209,7 @@ def test_transform_rnd_fr09_df():
 
 
 def test_transform_rnd_de03_df():
-    rnd_module = _load_module(
-        "app.etl.loaders.rnd_service", RndConfig=type("RndConfig", (), {})
-    )
+    from app.etl.loaders import rnd_service as rnd_module
 
     df = pd.DataFrame(
         [
@@ -0,0 +1,80 @@
+import numpy as np
+
+from app.handlers import _kernels
+
+
+def _sample_arrays():
+    rng = np.random.default_rng(42)
+    arrays = {
+        name: rng.normal(scale=1000.0, size=64)
+        for name in ("out", "base", "sm_oh", "oh_adm", "rt_oh", "total_sar")
+    }
+    positions = np.array([0, 3, 7, 20, 63], dtype=np.int64)
+    return arrays, positions
+
+
+def test_allocate_proportional_fallback_updates_only_positions():
+    out = np.array([1.0, 2.0, 3.0, 4.0])
+    base = np.array([10.0, 20.0, 30.0, 40.0])
+    positions = np.array([1, 3], dtype=np.int64)
+
+    _kernels._allocate_proportional_numpy(out, base, positions, 0.5)
+
+    np.testing.assert_array_equal(out, [1.0, 12.0, 3.0, 24.0])
+
+
+def test_adjust_sar_fallback_scales_and_recomputes_total():
+    sm_oh = np.array([10.0, 20.0])
+    oh_adm = np.array([1.0, 2.0])
+    rt_oh = np.array([100.0, 200.0])
+    total_sar = np.array([0.0, -1.0])
+    positions = np.array([1], dtype=np.int64)
+
+    _kernels._adjust_sar_numpy(sm_oh, oh_adm, rt_oh, total_sar, positions, 0.5)
+
+    np.testing.assert_array_equal(sm_oh, [10.0, 10.0])
+    np.testing.assert_array_equal(oh_adm, [1.0, 1.0])
+    np.testing.assert_array_equal(rt_oh, [100.0, 100.0])
+    # untouched rows keep their previous totals
+    np.testing.assert_array_equal(total_sar, [0.0, 111.0])
+
+
+def test_allocate_proportional_matches_numpy_fallback():
+    # exercises jitted vs fallback when numba is installed; without it
+    # both names are the same function and this still guards the API
+    arrays, positions = _sample_arrays()
+    out_active = arrays["out"].copy()
+    out_fallback = arrays["out"].copy()
+
+    _kernels.allocate_proportional(out_active, arrays["base"], positions, 0.73)
+    _kernels._allocate_proportional_numpy(
+        out_fallback, arrays["base"], positions, 0.73
+    )
+
+    np.testing.assert_array_equal(out_active, out_fallback)
+
+
+def test_adjust_sar_matches_numpy_fallback():
+    arrays, positions = _sample_arrays()
+    active = {k: arrays[k].copy() for k in ("sm_oh", "oh_adm", "rt_oh", "total_sar")}
+    fallback = {k: arrays[k].copy() for k in ("sm_oh", "oh_adm", "rt_oh", "total_sar")}
+
+    _kernels.adjust_sar(
+        active["sm_oh"],
+        active["oh_adm"],
+        active["rt_oh"],
+        active["total_sar"],
+        positions,
+        0.73,
+    )
+    _kernels._adjust_sar_numpy(
+        fallback["sm_oh"],
+        fallback["oh_adm"],
+        fallback["rt_oh"],
+        fallback["total_sar"],
+        positions,
+        0.73,
+    )
+
+    for name in ("sm_oh", "oh_adm", "rt_oh", "total_sar"):
+        np.testing.assert_array_equal(active[name], fallback[name])